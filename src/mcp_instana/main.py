@@ -4,19 +4,13 @@ Model Context Protocol (MCP) Server for IBM Instana
 Supports stdio and Streamable HTTP transports.
 """
 
-import argparse
+import importlib
 import logging
 import os
 import sys
-
-from dotenv import load_dotenv
-
-from mcp_instana import server, settings
-
-load_dotenv()
-
-# Tools
-import mcp_instana.tools
+from dataclasses import dataclass
+from functools import cache
+from typing import Dict, List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +28,101 @@ project_root = os.path.dirname(os.path.dirname(current_path))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+TRANSPORT_CHOICES = ("streamable-http", "stdio")
+LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+HELP_FLAGS = ("-h", "--h", "--help", "-help")
+
+# Tool packages under mcp_instana.tools, by tool category
+TOOL_CATEGORY_PACKAGES = {
+    "infra": "infrastructure",
+    "app": "application",
+    "events": "event",
+    "automation": "automation",
+    "website": "website",
+    "log": "log",
+    "settings": "settings",
+}
+
+# Options shown by --help as (flag, metavar, help) tuples
+OPTIONS_HELP = [
+    ("--help", "", "Show this help message and exit"),
+    ("--transport", "<mode>", "Set the transport mode: streamable-http, stdio. Defaults to stdio if not specified."),
+    ("--log-level", "", "Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"),
+    ("--debug", "", "Enable debug mode with additional logging (shortcut for --log-level DEBUG)"),
+    ("--tools", "<categoriy1,category2,...>", "Comma-separated list of tool categories to enable: infra,app,events,automation,website,log,settings. If not provided, all tools are enabled."),
+    ("--port", "", "Port to listen on (default: 8080, can be overridden with PORT env var)"),
+]
+
+@dataclass
+class Args:
+    """Command line arguments of the Instana MCP server."""
+    transport: Optional[str] = None
+    log_level: str = "INFO"
+    debug: bool = False
+    tools: Optional[str] = None
+    port: Optional[int] = None
+    help: bool = False
+
+def _parse_argv(argv: List[str]) -> Args:
+    """
+    Parse the command line arguments.
+
+    Options taking a value accept both the "--option value" and the
+    "--option=value" forms.
+
+    Args:
+        argv: The command line arguments, without the program name
+
+    Returns:
+        The parsed arguments
+
+    Raises:
+        ValueError: If an argument is unknown, is missing its value or has an invalid value
+    """
+    # Help is not allowed to be combined with other arguments
+    if any(arg in HELP_FLAGS for arg in argv):
+        if any(arg not in HELP_FLAGS for arg in argv):
+            raise ValueError("Argument -h/--h/--help/-help: not allowed with other arguments")
+        return Args(help=True)
+
+    args = Args()
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg == "--debug":
+            args.debug = True
+            continue
+
+        name, sep, value = arg.partition("=")
+        if name not in ("--transport", "--log-level", "--tools", "--port"):
+            raise ValueError(f"Unrecognized argument: {arg}")
+        if not sep:
+            # Like argparse, a following option is not taken as the value
+            if i >= len(argv) or argv[i].startswith("-"):
+                raise ValueError(f"Argument {name}: expected one argument")
+            value = argv[i]
+            i += 1
+
+        if name == "--transport":
+            if value not in TRANSPORT_CHOICES:
+                raise ValueError(f"Argument --transport: invalid choice: '{value}' (choose from {', '.join(TRANSPORT_CHOICES)})")
+            args.transport = value
+        elif name == "--log-level":
+            if value not in LOG_LEVEL_CHOICES:
+                raise ValueError(f"Argument --log-level: invalid choice: '{value}' (choose from {', '.join(LOG_LEVEL_CHOICES)})")
+            args.log_level = value
+        elif name == "--tools":
+            args.tools = value
+        else:
+            try:
+                args.port = int(value)
+            except ValueError:
+                raise ValueError(f"Argument --port: invalid int value: '{value}'")
+
+    return args
+
 def set_log_level(level_name):
     """Set the logging level based on the provided level name"""
     level_map = {
@@ -49,82 +138,60 @@ def set_log_level(level_name):
     logging.getLogger().setLevel(level)
     logger.debug(f"Log level set to {level_name.upper()}")
 
+# Environment variables used by the server, read once by _load_env()
+_ENV: Dict[str, str] = {}
+
+@cache
+def _load_dotenv_once():
+    """Load the .env file, if any. Subsequent calls are no-ops."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+def _load_env():
+    """Load the .env file, if any, and read the environment variables used by the server."""
+    _load_dotenv_once()
+    _ENV.update({k: os.environ.get(k, "") for k in ("INSTANA_API_TOKEN", "INSTANA_BASE_URL", "PORT")})
+
 def validate_credentials() -> bool:
     """Validate that Instana credentials are provided for stdio mode."""
     # For stdio mode, validate INSTANA_API_TOKEN and INSTANA_BASE_URL
-    token = (os.getenv("INSTANA_API_TOKEN") or "")
-    base_url = (os.getenv("INSTANA_BASE_URL") or "")
-    return not (not token or not base_url)
+    return bool(_ENV.get("INSTANA_API_TOKEN") and _ENV.get("INSTANA_BASE_URL"))
+
+def _bootstrap():
+    """
+    Import the MCP server and the tool modules of the enabled categories.
+
+    Importing FastMCP and the Instana SDK takes seconds, so this is deferred
+    until the command line has been parsed and the credentials validated.
+    """
+    from mcp_instana import server, settings
+
+    # Tools
+    for category in settings.global_tool_categories or TOOL_CATEGORY_PACKAGES:
+        package = TOOL_CATEGORY_PACKAGES.get(category)
+        if package is None:
+            logger.warning("Unknown tool category: %s", category)
+            continue
+        importlib.import_module(f"mcp_instana.tools.{package}")
+
+    return server
 
 def main():
     """Main entry point for Instana MCP server."""
     try:
-        # Create and configure the MCP server
-        parser = argparse.ArgumentParser(description="Instana MCP Server", add_help=False)
-        parser.add_argument(
-                "-h", "--help",
-                action="store_true",
-                dest="help",
-                help="Show this help message and exit"
-            )
-        parser.add_argument(
-            "--transport",
-            type=str,
-            choices=["streamable-http","stdio"],
-            metavar='<mode>',
-            help="Set the transport mode: streamable-http, stdio. Defaults to stdio if not specified."
-        )
-        parser.add_argument(
-            "--log-level",
-            type=str,
-            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-            default="INFO",
-            help="Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
-        )
-        parser.add_argument(
-            "--debug",
-            action="store_true",
-            help="Enable debug mode with additional logging (shortcut for --log-level DEBUG)"
-        )
-        parser.add_argument(
-            "--tools",
-            type=str,
-            metavar='<categoriy1,category2,...>',
-            help="Comma-separated list of tool categories to enable: infra,app,events,automation,website. If not provided, all tools are enabled."
-        )
-        parser.add_argument(
-            "--port",
-            type=int,
-            default=int(os.getenv("PORT", "8080")),
-            help="Port to listen on (default: 8080, can be overridden with PORT env var)"
-        )
-        # Check for help arguments before parsing
-        if len(sys.argv) > 1 and any(arg in ['-h','--h','--help','-help'] for arg in sys.argv[1:]):
-            # Check if help is combined with other arguments
-            help_args = ['-h','--h','--help','-help']
-            other_args = [arg for arg in sys.argv[1:] if arg not in help_args]
-
-            if other_args:
-                logger.error("Argument -h/--h/--help/-help: not allowed with other arguments")
-                sys.exit(2)
-
-            # Show help and exit
-            try:
-                logger.info("Available options:")
-                for action in parser._actions:
-                    # Only print options that start with '--' and have a help string
-                    if any(opt.startswith('--') for opt in action.option_strings) and action.help:
-                        # Find the first long option
-                        long_opt = next((opt for opt in action.option_strings if opt.startswith('--')), None)
-                        metavar = action.metavar or ''
-                        opt_str = f"{long_opt} {metavar}".strip()
-                        logger.info(f"{opt_str:<24} {action.help}")
-                sys.exit(0)
-            except Exception as e:
-                logger.error(f"Error displaying help: {e}")
-                sys.exit(0)  # Still exit with 0 for help
-
-        args = parser.parse_args()
+        try:
+            args = _parse_argv(sys.argv[1:])
+        except ValueError as e:
+            logger.error(str(e))
+            sys.exit(2)
+
+        # Show help and exit
+        if args.help:
+            logger.info("Available options:")
+            for flag, metavar, help_text in OPTIONS_HELP:
+                opt_str = f"{flag} {metavar}".strip()
+                logger.info(f"{opt_str:<24} {help_text}")
+            sys.exit(0)
 
         # Set log level based on command line arguments
         if args.debug:
@@ -132,8 +199,12 @@ def main():
         elif args.log_level != "INFO":
             set_log_level(args.log_level)
 
+        _load_env()
+
         # Retrieve the tool categories if specified
+        from mcp_instana import settings
         settings.global_tool_categories = args.tools.split(",") if args.tools else None
+        settings.global_tool_categories_set = frozenset(settings.global_tool_categories) if settings.global_tool_categories else None
         print(f"Enabled tool categories: {settings.global_tool_categories or 'all'}")
 
         # In stdio mode, the credentials must be provided via environment variables
@@ -142,9 +213,14 @@ def main():
                 logger.error("Error: Instana credentials are required for stdio mode but not provided. Please set INSTANA_API_TOKEN and INSTANA_BASE_URL environment variables.")
                 sys.exit(1)
 
+        # The PORT default is resolved here so that it can come from the .env file
+        port = args.port if args.port is not None else int(_ENV["PORT"] or 8080)
+
+        server = _bootstrap()
+
         # Start the MCP server
         try:
-            server.run(args.transport, args.port)
+            server.run(args.transport, port)
         except Exception as e:
             print(f"Failed to create MCP server: {e}", file=sys.stderr)
             sys.exit(1)
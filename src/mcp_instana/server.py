@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+import time
 from typing import Any
 
 from fastmcp import FastMCP
@@ -11,13 +13,17 @@ from mcp_instana import settings
 
 logger = logging.getLogger(__name__)
 
+# Duplicate tool, resource and prompt names are errors in development (MCP_INSTANA_DEV set),
+# otherwise they are logged as warnings and the last registration replaces the earlier one
+_DUP = "error" if os.environ.get("MCP_INSTANA_DEV") else "warn"
+
 # Create the MCP server instance
 mcp = FastMCP(
     name = "Instana MCP Server",
     # Configure behaviors for duplicate names
-    on_duplicate_tools="error",
-    on_duplicate_resources="error",
-    on_duplicate_prompts="error"
+    on_duplicate_tools=_DUP,
+    on_duplicate_resources=_DUP,
+    on_duplicate_prompts=_DUP
 )
 
 # Logging middleware
@@ -26,32 +32,37 @@ class LoggingMiddleware(Middleware):
 
     async def on_message(self, context: MiddlewareContext, call_next):
         """Called for all MCP messages."""
-        logger.info(f"Processing {context.method} from {context.source}")
+        # Skip all the logging work when INFO messages would be discarded anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return await call_next(context)
+
+        # MiddlewareContext always defines method and source, no getattr() fallbacks needed
+        method = context.method
+        logger.info("Processing %s from %s", method, context.source)
+        start = time.perf_counter()
 
         result = await call_next(context)
 
-        logger.info(f"Completed {context.method}")
+        logger.info("Completed %s in %.1fms", method, (time.perf_counter() - start) * 1000)
         return result
 
-# Tag-based tool filtering middleware
-class TagBasedToolFilterMiddleware(Middleware):
-    async def on_list_tools(self, context: MiddlewareContext, call_next):
-        """
-        Intercept the list_tools response and filter by allowed categories.
-        Each tool is expected to have tags among the categories of .
-        """
-        result = await call_next(context)
+def _filter_tools():
+    """
+    Remove the tools whose tags do not match any of the enabled tool categories.
+
+    The enabled categories are fixed for the lifetime of the process, so the
+    tools are filtered once at startup rather than on every tools/list call.
+    """
+    allowed = settings.global_tool_categories_set
+    if allowed is None:
+        logger.info("Enable all tools without filtering")
+        return
 
-        if not settings.global_tool_categories:
-            logger.info("List all tools without filtering")
-            return result
-        else:
-            filtered = []
-            for tool in result:
-                if bool(set(settings.global_tool_categories) & set(tool.tags)):
-                    filtered.append(tool)
-            logger.info(f"List tools filtered by categories: {settings.global_tool_categories}, total {len(filtered)} tools")
-            return filtered
+    tools = asyncio.run(mcp.get_tools())
+    removed = [name for name, tool in tools.items() if allowed.isdisjoint(tool.tags)]
+    for name in removed:
+        mcp.remove_tool(name)
+    logger.info("Tools filtered by categories: %s, total %d tools", settings.global_tool_categories, len(tools) - len(removed))
 
 def run(mode: str, port: int):
     """Configure and run the MCP server."""
@@ -60,23 +71,27 @@ def run(mode: str, port: int):
     logger.info("Adding LoggingMiddleware")
     mcp.add_middleware(LoggingMiddleware())
 
-    # Adding TagBasedToolFilterMiddleware middleware
-    logger.info("Adding TagBasedToolFilterMiddleware")
-    mcp.add_middleware(TagBasedToolFilterMiddleware())
-
-    # Adding rate limiting (allows controlled bursts)
-    logger.info("Adding RateLimitingMiddleware")
-    mcp.add_middleware(RateLimitingMiddleware(
-        max_requests_per_second=100.0,
-        burst_capacity=20
-    ))
-
-    # Adding automatic retry with exponential backoff
-    logger.info("Adding RetryMiddleware")
-    mcp.add_middleware(RetryMiddleware(
-        max_retries=3,
-        retry_exceptions=(ConnectionError, TimeoutError)
-    ))
+    # Removing the tools of the disabled categories
+    _filter_tools()
+
+    # Rate limiting and retries only matter when serving remote clients over HTTP,
+    # in stdio mode the server has a single local client
+    if mode == "streamable-http":
+        # Adding rate limiting (allows controlled bursts)
+        logger.info("Adding RateLimitingMiddleware")
+        mcp.add_middleware(RateLimitingMiddleware(
+            max_requests_per_second=100.0,
+            burst_capacity=20
+        ))
+
+        # Adding automatic retry with exponential backoff
+        logger.info("Adding RetryMiddleware")
+        mcp.add_middleware(RetryMiddleware(
+            max_retries=3,
+            retry_exceptions=(ConnectionError, TimeoutError)
+        ))
+    else:
+        logger.info("Skipping RateLimitingMiddleware and RetryMiddleware in stdio mode")
 
     if mode == "streamable-http":
         logger.info(f"Starting MCP server in streamable-http mode on port {port}")
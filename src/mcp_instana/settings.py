@@ -6,3 +6,6 @@ global_instana_base_url = None
 
 # List of tool categories to enable, e.g., ["infra", "app", "events", "automation", "website", "log"]
 global_tool_categories = None
+
+# Same as global_tool_categories but as a frozenset, for fast tag lookups
+global_tool_categories_set = None
@@ -60,14 +60,14 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the Smart Alert Configuration or error information
         """
         try:
-            logger.debug(f"find_application_alert_config called with id={id}, valid_on={valid_on}")
+            logger.debug("find_application_alert_config called with id=%s, valid_on=%s", id, valid_on)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the find_application_alert_config method from the SDK
-            logger.debug(f"Calling find_application_alert_config with id={id}, valid_on={valid_on}")
+            logger.debug("Calling find_application_alert_config with id=%s, valid_on=%s", id, valid_on)
             result = api_client.find_application_alert_config(
                 id=id,
                 valid_on=valid_on
@@ -80,10 +80,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from find_application_alert_config: {result_dict}")
+            logger.debug("Result from find_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in find_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in find_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to get application alert config: {e!s}"}
 
 
@@ -109,14 +109,14 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the Smart Alert Configuration versions or error information
         """
         try:
-            logger.debug(f"find_application_alert_config_versions called with id={id}")
+            logger.debug("find_application_alert_config_versions called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the find_application_alert_config_versions method from the SDK
-            logger.debug(f"Calling find_application_alert_config_versions with id={id}")
+            logger.debug("Calling find_application_alert_config_versions with id=%s", id)
             result = api_client.find_application_alert_config_versions(
                 id=id
             )
@@ -132,10 +132,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result if isinstance(result, dict) else {"data": result}
 
-            logger.debug(f"Result from find_application_alert_config_versions: {result_dict}")
+            logger.debug("Result from find_application_alert_config_versions: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in find_application_alert_config_versions: {e}", exc_info=True)
+            logger.error("Error in find_application_alert_config_versions: %s", e, exc_info=True)
             return {"error": f"Failed to get application alert config versions: {e!s}"}
 
     @register_as_tool(
@@ -162,10 +162,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing Smart Alert Configurations or error information
         """
         try:
-            logger.debug(f"get_application_alert_configs called with application_id={application_id}, alert_ids={alert_ids}")
+            logger.debug("get_application_alert_configs called with application_id=%s, alert_ids=%s", application_id, alert_ids)
 
             # Call the find_active_application_alert_configs method from the SDK
-            logger.debug(f"Calling find_active_application_alert_configs with application_id={application_id}, alert_ids={alert_ids}")
+            logger.debug("Calling find_active_application_alert_configs with application_id=%s, alert_ids=%s", application_id, alert_ids)
             result = api_client.find_active_application_alert_configs(
                 application_id=application_id,
                 alert_ids=alert_ids
@@ -182,10 +182,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result if isinstance(result, dict) else {"data": result}
 
-            logger.debug(f"Result from find_active_application_alert_configs: {result_dict}")
+            logger.debug("Result from find_active_application_alert_configs: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_application_alert_configs: {e}", exc_info=True)
+            logger.error("Error in get_application_alert_configs: %s", e, exc_info=True)
             return {"error": f"Failed to get application alert configs: {e!s}"}
 
     @register_as_tool(
@@ -210,14 +210,14 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the deletion operation or error information
         """
         try:
-            logger.debug(f"delete_application_alert_config called with id={id}")
+            logger.debug("delete_application_alert_config called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the delete_application_alert_config method from the SDK
-            logger.debug(f"Calling delete_application_alert_config with id={id}")
+            logger.debug("Calling delete_application_alert_config with id=%s", id)
             api_client.delete_application_alert_config(id=id)
 
             # The delete operation doesn't return a result, so we'll create a success message
@@ -226,10 +226,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 "message": f"Smart Alert Configuration with ID '{id}' has been successfully deleted"
             }
 
-            logger.debug(f"Result from delete_application_alert_config: {result_dict}")
+            logger.debug("Result from delete_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in delete_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in delete_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to delete application alert config: {e!s}"}
 
     @register_as_tool(
@@ -254,14 +254,14 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the enable operation or error information
         """
         try:
-            logger.debug(f"enable_application_alert_config called with id={id}")
+            logger.debug("enable_application_alert_config called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the enable_application_alert_config method from the SDK
-            logger.debug(f"Calling enable_application_alert_config with id={id}")
+            logger.debug("Calling enable_application_alert_config with id=%s", id)
             result = api_client.enable_application_alert_config(id=id)
 
             # Convert the result to a dictionary
@@ -274,10 +274,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                     "message": f"Smart Alert Configuration with ID '{id}' has been successfully enabled"
                 }
 
-            logger.debug(f"Result from enable_application_alert_config: {result_dict}")
+            logger.debug("Result from enable_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in enable_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in enable_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to enable application alert config: {e!s}"}
 
     @register_as_tool(
@@ -302,14 +302,14 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the disable operation or error information
         """
         try:
-            logger.debug(f"disable_application_alert_config called with id={id}")
+            logger.debug("disable_application_alert_config called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the disable_application_alert_config method from the SDK
-            logger.debug(f"Calling disable_application_alert_config with id={id}")
+            logger.debug("Calling disable_application_alert_config with id=%s", id)
             result = api_client.disable_application_alert_config(id=id)
 
             # Convert the result to a dictionary
@@ -322,10 +322,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                     "message": f"Smart Alert Configuration with ID '{id}' has been successfully disabled"
                 }
 
-            logger.debug(f"Result from disable_application_alert_config: {result_dict}")
+            logger.debug("Result from disable_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in disable_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in disable_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to disable application alert config: {e!s}"}
 
     @register_as_tool(
@@ -352,7 +352,7 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the restore operation or error information
         """
         try:
-            logger.debug(f"restore_application_alert_config called with id={id}, created={created}")
+            logger.debug("restore_application_alert_config called with id=%s, created=%s", id, created)
 
             # Validate required parameters
             if not id:
@@ -362,7 +362,7 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 return {"error": "created timestamp is required"}
 
             # Call the restore_application_alert_config method from the SDK
-            logger.debug(f"Calling restore_application_alert_config with id={id}, created={created}")
+            logger.debug("Calling restore_application_alert_config with id=%s, created=%s", id, created)
             result = api_client.restore_application_alert_config(id=id, created=created)
 
             # Convert the result to a dictionary
@@ -375,10 +375,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                     "message": f"Smart Alert Configuration with ID '{id}' and creation timestamp '{created}' has been successfully restored"
                 }
 
-            logger.debug(f"Result from restore_application_alert_config: {result_dict}")
+            logger.debug("Result from restore_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in restore_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in restore_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to restore application alert config: {e!s}"}
 
     @register_as_tool(
@@ -403,14 +403,14 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the baseline update operation or error information
         """
         try:
-            logger.debug(f"update_application_alert_config_baseline called with id={id}")
+            logger.debug("update_application_alert_config_baseline called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the update_application_historic_baseline method from the SDK
-            logger.debug(f"Calling update_application_historic_baseline with id={id}")
+            logger.debug("Calling update_application_historic_baseline with id=%s", id)
             result = api_client.update_application_historic_baseline(id=id)
 
             # Convert the result to a dictionary
@@ -423,10 +423,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                     "message": f"Historic baseline for Smart Alert Configuration with ID '{id}' has been successfully recalculated"
                 }
 
-            logger.debug(f"Result from update_application_historic_baseline: {result_dict}")
+            logger.debug("Result from update_application_historic_baseline: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_application_alert_config_baseline: {e}", exc_info=True)
+            logger.error("Error in update_application_alert_config_baseline: %s", e, exc_info=True)
             return {"error": f"Failed to update application alert config baseline: {e!s}"}
 
     @register_as_tool(
@@ -476,7 +476,7 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the created Smart Alert Configuration or error information
         """
         try:
-            logger.debug(f"create_application_alert_config called with payload={payload}")
+            logger.debug("create_application_alert_config called with payload=%s", payload)
 
             # Parse the payload if it's a string
             if isinstance(payload, str):
@@ -488,7 +488,7 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -504,10 +504,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -525,16 +525,16 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ApplicationAlertConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ApplicationAlertConfig: {e}")
+                logger.debug("Error importing ApplicationAlertConfig: %s", e)
                 return {"error": f"Failed to import ApplicationAlertConfig: {e!s}"}
 
             # Create an ApplicationAlertConfig object from the request body
             try:
-                logger.debug(f"Creating ApplicationAlertConfig with params: {request_body}")
+                logger.debug("Creating ApplicationAlertConfig with params: %s", request_body)
                 config_object = ApplicationAlertConfig(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating ApplicationAlertConfig: {e}")
+                logger.debug("Error creating ApplicationAlertConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the create_application_alert_config method from the SDK
@@ -548,10 +548,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from create_application_alert_config: {result_dict}")
+            logger.debug("Result from create_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in create_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in create_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to create application alert config: {e!s}"}
 
     @register_as_tool(
@@ -603,7 +603,7 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
             Dictionary containing the updated Smart Alert Configuration or error information
         """
         try:
-            logger.debug(f"update_application_alert_config called with id={id}, payload={payload}")
+            logger.debug("update_application_alert_config called with id=%s, payload=%s", id, payload)
 
             # Validate required parameters
             if not id:
@@ -622,7 +622,7 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -638,10 +638,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -655,20 +655,20 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ApplicationAlertConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ApplicationAlertConfig: {e}")
+                logger.debug("Error importing ApplicationAlertConfig: %s", e)
                 return {"error": f"Failed to import ApplicationAlertConfig: {e!s}"}
 
             # Create an ApplicationAlertConfig object from the request body
             try:
-                logger.debug(f"Creating ApplicationAlertConfig with params: {request_body}")
+                logger.debug("Creating ApplicationAlertConfig with params: %s", request_body)
                 config_object = ApplicationAlertConfig(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating ApplicationAlertConfig: {e}")
+                logger.debug("Error creating ApplicationAlertConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the update_application_alert_config method from the SDK
-            logger.debug(f"Calling update_application_alert_config with id={id} and config object")
+            logger.debug("Calling update_application_alert_config with id=%s and config object", id)
             result = api_client.update_application_alert_config(
                 id=id,
                 application_alert_config=config_object
@@ -684,10 +684,10 @@ class ApplicationAlertMCPTools(BaseInstanaClient):
                     "message": f"Smart Alert Configuration with ID '{id}' has been successfully updated"
                 }
 
-            logger.debug(f"Result from update_application_alert_config: {result_dict}")
+            logger.debug("Result from update_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_application_alert_config: {e}")
+            logger.error("Error in update_application_alert_config: %s", e)
             return {"error": f"Failed to update application alert config: {e!s}"}
 
 
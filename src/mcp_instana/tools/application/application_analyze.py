@@ -53,7 +53,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
             # Initialize the Instana SDK's ApplicationAnalyzeApi with our configured client
             self.analyze_api = ApplicationAnalyzeApi(api_client=api_client)
         except Exception as e:
-            logger.error(f"Error initializing ApplicationAnalyzeApi: {e}", exc_info=True)
+            logger.error("Error initializing ApplicationAnalyzeApi: %s", e, exc_info=True)
             raise
 
     @register_as_tool(
@@ -85,7 +85,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 logger.warning("Both trace_id and call_id must be provided")
                 return {"error": "Both trace_id and call_id must be provided"}
 
-            logger.debug(f"Fetching call details for trace_id={trace_id}, call_id={call_id}")
+            logger.debug("Fetching call details for trace_id=%s, call_id=%s", trace_id, call_id)
             result = api_client.get_call_details(
                 trace_id=trace_id,
                 call_id=call_id
@@ -98,12 +98,12 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_call_details: {result_dict}")
+            logger.debug("Result from get_call_details: %s", result_dict)
             # Ensure we return a dictionary
             return dict(result_dict) if not isinstance(result_dict, dict) else result_dict
 
         except Exception as e:
-            logger.error(f"Error getting call details: {e}", exc_info=True)
+            logger.error("Error getting call details: %s", e, exc_info=True)
             return {"error": f"Failed to get call details: {e!s}"}
 
     @register_as_tool(
@@ -144,10 +144,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 return {"error": "If offset is provided, ingestionTime must also be provided"}
 
             if retrievalSize is not None and (retrievalSize < 1 or retrievalSize > 10000):
-                logger.warning(f"retrievalSize must be between 1 and 10000, got: {retrievalSize}")
+                logger.warning("retrievalSize must be between 1 and 10000, got: %s", retrievalSize)
                 return {"error": "retrievalSize must be between 1 and 10000"}
 
-            logger.debug(f"Fetching trace details for id={id}")
+            logger.debug("Fetching trace details for id=%s", id)
             result = api_client.get_trace_download(
                 id=id,
                 retrieval_size=retrievalSize,
@@ -162,12 +162,12 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_trace_details: {result_dict}")
+            logger.debug("Result from get_trace_details: %s", result_dict)
             # Ensure we return a dictionary
             return dict(result_dict) if not isinstance(result_dict, dict) else result_dict
 
         except Exception as e:
-            logger.error(f"Error getting trace details: {e}", exc_info=True)
+            logger.error("Error getting trace details: %s", e, exc_info=True)
             return {"error": f"Failed to get trace details: {e!s}"}
 
 
@@ -232,7 +232,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -248,10 +248,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -266,7 +266,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 from instana_client.models.group import Group
                 logger.debug("Successfully imported GetTraces")
             except ImportError as e:
-                logger.debug(f"Error importing GetTraces: {e}")
+                logger.debug("Error importing GetTraces: %s", e)
                 return {"error": f"Failed to import GetTraces: {e!s}"}
 
             # Create an GetTraces object from the request body
@@ -274,11 +274,11 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 query_params = {}
                 if request_body and "tag_filter_expression" in request_body:
                     query_params["tag_filter_expression"] = request_body["tag_filter_expression"]
-                logger.debug(f"Creating get_traces with params: {query_params}")
+                logger.debug("Creating get_traces with params: %s", query_params)
                 config_object = GetTraces(**query_params)
                 logger.debug("Successfully got traces")
             except Exception as e:
-                logger.debug(f"Error creating get_traces: {e}")
+                logger.debug("Error creating get_traces: %s", e)
                 return {"error": f"Failed to get tracest: {e!s}"}
 
             # Call the get_traces method from the SDK
@@ -296,10 +296,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                     "message": "Get traces"
                 }
 
-            logger.debug(f"Result from get_traces: {result_dict}")
+            logger.debug("Result from get_traces: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_traces: {e}")
+            logger.error("Error in get_traces: %s", e)
             return {"error": f"Failed to get traces: {e!s}"}
 
     @register_as_tool(
@@ -375,7 +375,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -391,10 +391,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -409,7 +409,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 from instana_client.models.group import Group
                 logger.debug("Successfully imported GetTraceGroups")
             except ImportError as e:
-                logger.debug(f"Error importing GetTraceGroups: {e}")
+                logger.debug("Error importing GetTraceGroups: %s", e)
                 return {"error": f"Failed to import GetTraceGroups: {e!s}"}
 
             # Create an GetTraceGroups object from the request body
@@ -421,11 +421,11 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                     query_params["metrics"] = request_body["metrics"]
                 if request_body and "tag_filter_expression" in request_body:
                     query_params["tag_filter_expression"] = request_body["tag_filter_expression"]
-                logger.debug(f"Creating GetTraceGroups with params: {query_params}")
+                logger.debug("Creating GetTraceGroups with params: %s", query_params)
                 config_object = GetTraceGroups(**query_params)
                 logger.debug("Successfully created endpoint config object")
             except Exception as e:
-                logger.debug(f"Error creating GetTraceGroups: {e}")
+                logger.debug("Error creating GetTraceGroups: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the create_endpoint_config method from the SDK
@@ -443,10 +443,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                     "message": "Grouped trace metrics"
                 }
 
-            logger.debug(f"Result from get_grouped_trace_metrics: {result_dict}")
+            logger.debug("Result from get_grouped_trace_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_grouped_trace_metrics: {e}")
+            logger.error("Error in get_grouped_trace_metrics: %s", e)
             return {"error": f"Failed to get grouped trace metrics: {e!s}"}
 
     @register_as_tool(
@@ -533,7 +533,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -549,10 +549,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -567,7 +567,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                 from instana_client.models.group import Group
                 logger.debug("Successfully imported GetCallGroups")
             except ImportError as e:
-                logger.debug(f"Error importing GetCallGroups: {e}")
+                logger.debug("Error importing GetCallGroups: %s", e)
                 return {"error": f"Failed to import GetCallGroups: {e!s}"}
 
             # Create an GetCallGroups object from the request body
@@ -577,11 +577,11 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                     query_params["group"] = request_body["group"]
                 if request_body and "metrics" in request_body:
                     query_params["metrics"] = request_body["metrics"]
-                logger.debug(f"Creating GetCallGroups with params: {query_params}")
+                logger.debug("Creating GetCallGroups with params: %s", query_params)
                 config_object = GetCallGroups(**query_params)
                 logger.debug("Successfully created endpoint config object")
             except Exception as e:
-                logger.error(f"Error creating GetCallGroups: {e}")
+                logger.error("Error creating GetCallGroups: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the get_call_groups method from the SDK
@@ -599,10 +599,10 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
                     "message": "Get Grouped call"
                 }
 
-            logger.debug(f"Result from get_call_group: {result_dict}")
+            logger.debug("Result from get_call_group: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_call_group: {e}")
+            logger.error("Error in get_call_group: %s", e)
             return {"error": f"Failed to get grouped call: {e!s}"}
 
 
@@ -640,7 +640,7 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
 
             result_dict = result.to_dict() if hasattr(result, 'to_dict') else result
 
-            logger.debug(f"Result from get_correlated_traces: {result_dict}")
+            logger.debug("Result from get_correlated_traces: %s", result_dict)
             # If result is a list, convert it to a dictionary
             if isinstance(result_dict, list):
                 return {"traces": result_dict}
@@ -648,5 +648,5 @@ class ApplicationAnalyzeMCPTools(BaseInstanaClient):
             return dict(result_dict) if not isinstance(result_dict, dict) else result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_correlated_traces: {e}", exc_info=True)
+            logger.error("Error in get_correlated_traces: %s", e, exc_info=True)
             return {"error": f"Failed to get correlated traces: {e!s}"}
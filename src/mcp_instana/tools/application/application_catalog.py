@@ -7,8 +7,8 @@ This module provides application catalog-specific MCP tools for Instana monitori
 import json
 import logging
 import sys
+import time
 import traceback
-from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -27,7 +27,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 # Configure logger for this module
@@ -66,10 +66,10 @@ class ApplicationCatalogMCPTools(BaseInstanaClient):
             A dictionary containing the application tag catalog data
         """
         try:
-            logger.debug(f"get_application_tag_catalog called with use_case={use_case}, data_source={data_source}, var_from={var_from}")
+            logger.debug("get_application_tag_catalog called with use_case=%s, data_source=%s, var_from=%s", use_case, data_source, var_from)
 
             if not var_from:
-                var_from = int((datetime.now() - timedelta(hours=1)).timestamp() * 1000)
+                var_from = time.time_ns() // 1_000_000 - (60 * 60 * 1000)
 
             raw_response = api_client.get_application_tag_catalog_without_preload_content(
                 use_case=use_case,
@@ -100,14 +100,14 @@ class ApplicationCatalogMCPTools(BaseInstanaClient):
             elif isinstance(parsed, dict):
                 result_dict = trim_tag_tree(parsed)
             else:
-                logger.debug(f"Unexpected response format: {type(parsed)}")
+                logger.debug("Unexpected response format: %s", type(parsed))
                 return {"error": "Unexpected response format from API"}
 
-            logger.debug(f"Result from get_application_tag_catalog: {result_dict}")
+            logger.debug("Result from get_application_tag_catalog: %s", result_dict)
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_application_tag_catalog: {e}", exc_info=True)
+            logger.error("Error in get_application_tag_catalog: %s", e, exc_info=True)
             return {"error": f"Failed to get application catalog: {e!s}"}
 
 
@@ -155,9 +155,9 @@ class ApplicationCatalogMCPTools(BaseInstanaClient):
                 except Exception:
                     result_dict = {"metrics": [str(result_data)]}
 
-            logger.debug(f"Result from get_application_metric_catalog: {result_dict}")
+            logger.debug("Result from get_application_metric_catalog: %s", result_dict)
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_application_metric_catalog: {e}", exc_info=True)
+            logger.error("Error in get_application_metric_catalog: %s", e, exc_info=True)
             return {"error": f"Failed to get application metric catalog: {e!s}"}
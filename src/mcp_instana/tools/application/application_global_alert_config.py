@@ -62,14 +62,14 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the Smart Alert Configuration or error information
         """
         try:
-            logger.debug(f"find_active_global_application_alert_configs called with application_id={application_id}, alert_ids={alert_ids}")
+            logger.debug("find_active_global_application_alert_configs called with application_id=%s, alert_ids=%s", application_id, alert_ids)
 
             # Validate required parameters
             if not application_id:
                 return [{"error": "application_id is required"}]
 
             # Call the find_active_global_application_alert_configs method from the SDK
-            logger.debug(f"Calling find_active_global_application_alert_configs with application_id={application_id}, alert_ids={alert_ids}")
+            logger.debug("Calling find_active_global_application_alert_configs with application_id=%s, alert_ids=%s", application_id, alert_ids)
             result = api_client.find_active_global_application_alert_configs(
                 application_id=application_id,
                 alert_ids=alert_ids
@@ -91,10 +91,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or other format, wrap it in a list
                 result_list = [result] if result else []
 
-            logger.debug(f"Result from find_active_global_application_alert_configs: {result_list}")
+            logger.debug("Result from find_active_global_application_alert_configs: %s", result_list)
             return result_list
         except Exception as e:
-            logger.error(f"Error in find_active_global_application_alert_configs: {e}", exc_info=True)
+            logger.error("Error in find_active_global_application_alert_configs: %s", e, exc_info=True)
             return [{"error": f"Failed to get active global application alert config: {e!s}"}]
 
 
@@ -120,14 +120,14 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the Smart Alert Configuration versions or error information
         """
         try:
-            logger.debug(f"find_global_application_alert_config_versions called with id={id}")
+            logger.debug("find_global_application_alert_config_versions called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the find_global_application_alert_config_versions method from the SDK
-            logger.debug(f"Calling find_global_application_alert_config_versions with id={id}")
+            logger.debug("Calling find_global_application_alert_config_versions with id=%s", id)
             result = api_client.find_global_application_alert_config_versions(
                 id=id
             )
@@ -143,10 +143,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result if isinstance(result, dict) else {"data": result}
 
-            logger.debug(f"Result from find_global_application_alert_config_versions: {result_dict}")
+            logger.debug("Result from find_global_application_alert_config_versions: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in find_global_application_alert_config_versions: {e}", exc_info=True)
+            logger.error("Error in find_global_application_alert_config_versions: %s", e, exc_info=True)
             return {"error": f"Failed to get global application alert config versions: {e!s}"}
 
     @register_as_tool(
@@ -172,10 +172,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing Smart Alert Configurations or error information
         """
         try:
-            logger.debug(f"get_application_alert_configs called with id={id}, valid_on={valid_on}")
+            logger.debug("get_application_alert_configs called with id=%s, valid_on=%s", id, valid_on)
 
             # Call the find_global_application_alert_config method from the SDK
-            logger.debug(f"Calling find_global_application_alert_config with id={id}, valid_on={valid_on}")
+            logger.debug("Calling find_global_application_alert_config with id=%s, valid_on=%s", id, valid_on)
             result = api_client.find_global_application_alert_config(
                 id=id,
                 valid_on=valid_on
@@ -192,10 +192,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result if isinstance(result, dict) else {"data": result}
 
-            logger.debug(f"Result from find_global_application_alert_config: {result_dict}")
+            logger.debug("Result from find_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in find_global_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in find_global_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to get global application alert configs: {e!s}"}
 
     @register_as_tool(
@@ -220,14 +220,14 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the deletion operation or error information
         """
         try:
-            logger.debug(f"delete_global_application_alert_config called with id={id}")
+            logger.debug("delete_global_application_alert_config called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the delete_global_application_alert_config method from the SDK
-            logger.debug(f"Calling delete_global_application_alert_config with id={id}")
+            logger.debug("Calling delete_global_application_alert_config with id=%s", id)
             api_client.delete_global_application_alert_config(id=id)
 
             # The delete operation doesn't return a result, so we'll create a success message
@@ -236,10 +236,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 "message": f"Global Smart Alert Configuration with ID '{id}' has been successfully deleted"
             }
 
-            logger.debug(f"Result from delete_global_application_alert_config: {result_dict}")
+            logger.debug("Result from delete_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in delete_global_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in delete_global_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to delete global application alert config: {e!s}"}
 
     @register_as_tool(
@@ -264,14 +264,14 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the enable operation or error information
         """
         try:
-            logger.debug(f"enable_global_application_alert_config called with id={id}")
+            logger.debug("enable_global_application_alert_config called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the enable_global_application_alert_config method from the SDK
-            logger.debug(f"Calling enable_global_application_alert_config with id={id}")
+            logger.debug("Calling enable_global_application_alert_config with id=%s", id)
             result = api_client.enable_global_application_alert_config(id=id)
 
             # Convert the result to a dictionary
@@ -284,10 +284,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                     "message": f"Global Smart Alert Configuration with ID '{id}' has been successfully enabled"
                 }
 
-            logger.debug(f"Result from enable_global_application_alert_config: {result_dict}")
+            logger.debug("Result from enable_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in enable_global_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in enable_global_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to enable global application alert config: {e!s}"}
 
     @register_as_tool(
@@ -312,14 +312,14 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the disable operation or error information
         """
         try:
-            logger.debug(f"disable_global_application_alert_config called with id={id}")
+            logger.debug("disable_global_application_alert_config called with id=%s", id)
 
             # Validate required parameters
             if not id:
                 return {"error": "id is required"}
 
             # Call the disable_global_application_alert_config method from the SDK
-            logger.debug(f"Calling disable_global_application_alert_config with id={id}")
+            logger.debug("Calling disable_global_application_alert_config with id=%s", id)
             result = api_client.disable_global_application_alert_config(id=id)
 
             # Convert the result to a dictionary
@@ -332,10 +332,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                     "message": f"Smart Alert Configuration with ID '{id}' has been successfully disabled"
                 }
 
-            logger.debug(f"Result from disable_global_application_alert_config: {result_dict}")
+            logger.debug("Result from disable_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in disable_global_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in disable_global_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to disable global application alert config: {e!s}"}
 
     @register_as_tool(
@@ -362,7 +362,7 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the result of the restore operation or error information
         """
         try:
-            logger.debug(f"restore_global_application_alert_config called with id={id}, created={created}")
+            logger.debug("restore_global_application_alert_config called with id=%s, created=%s", id, created)
 
             # Validate required parameters
             if not id:
@@ -372,7 +372,7 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 return {"error": "created timestamp is required"}
 
             # Call the restore_global_application_alert_config method from the SDK
-            logger.debug(f"Calling restore_global_application_alert_config with id={id}, created={created}")
+            logger.debug("Calling restore_global_application_alert_config with id=%s, created=%s", id, created)
             result = api_client.restore_global_application_alert_config(id=id, created=created)
 
             # Convert the result to a dictionary
@@ -385,10 +385,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                     "message": f"Global Smart Alert Configuration with ID '{id}' and creation timestamp '{created}' has been successfully restored"
                 }
 
-            logger.debug(f"Result from restore_global_application_alert_config: {result_dict}")
+            logger.debug("Result from restore_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in restore_global_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in restore_global_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to restore global application alert config: {e!s}"}
 
     @register_as_tool(
@@ -458,7 +458,7 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the created new Global Smart Alert Configuration or error information
         """
         try:
-            logger.debug(f"create_global_application_alert_config called with payload={payload}")
+            logger.debug("create_global_application_alert_config called with payload=%s", payload)
 
             # Parse the payload if it's a string
             if isinstance(payload, str):
@@ -470,7 +470,7 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -486,10 +486,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -507,16 +507,16 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GlobalApplicationsAlertConfig")
             except ImportError as e:
-                logger.debug(f"Error importing GlobalApplicationsAlertConfig: {e}")
+                logger.debug("Error importing GlobalApplicationsAlertConfig: %s", e)
                 return {"error": f"Failed to import GlobalApplicationsAlertConfig: {e!s}"}
 
             # Create an GlobalApplicationsAlertConfig object from the request body
             try:
-                logger.debug(f"Creating GlobalApplicationsAlertConfig with params: {request_body}")
+                logger.debug("Creating GlobalApplicationsAlertConfig with params: %s", request_body)
                 config_object = GlobalApplicationsAlertConfig(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating GlobalApplicationsAlertConfig: {e}")
+                logger.debug("Error creating GlobalApplicationsAlertConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the create_global_application_alert_config method from the SDK
@@ -530,10 +530,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from create_global_application_alert_config: {result_dict}")
+            logger.debug("Result from create_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in create_global_application_alert_config: {e}", exc_info=True)
+            logger.error("Error in create_global_application_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to create global application alert config: {e!s}"}
 
     @register_as_tool(
@@ -605,7 +605,7 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
             Dictionary containing the updated Global Smart Alert Configuration or error information
         """
         try:
-            logger.debug(f"update_global_application_alert_config called with id={id}, payload={payload}")
+            logger.debug("update_global_application_alert_config called with id=%s, payload=%s", id, payload)
 
             # Validate required parameters
             if not id:
@@ -624,7 +624,7 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -640,10 +640,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -657,20 +657,20 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GlobalApplicationsAlertConfig")
             except ImportError as e:
-                logger.debug(f"Error importing GlobalApplicationsAlertConfig: {e}")
+                logger.debug("Error importing GlobalApplicationsAlertConfig: %s", e)
                 return {"error": f"Failed to import GlobalApplicationsAlertConfig: {e!s}"}
 
             # Create an GlobalApplicationsAlertConfig object from the request body
             try:
-                logger.debug(f"Creating GlobalApplicationsAlertConfig with params: {request_body}")
+                logger.debug("Creating GlobalApplicationsAlertConfig with params: %s", request_body)
                 config_object = GlobalApplicationsAlertConfig(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating ApplicationAlertConfig: {e}")
+                logger.debug("Error creating ApplicationAlertConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the update_global_application_alert_config method from the SDK
-            logger.debug(f"Calling update_global_application_alert_config with id={id} and config object")
+            logger.debug("Calling update_global_application_alert_config with id=%s and config object", id)
             result = api_client.update_global_application_alert_config(
                 id=id,
                 global_applications_alert_config=config_object
@@ -686,10 +686,10 @@ class ApplicationGlobalAlertMCPTools(BaseInstanaClient):
                     "message": f"Smart Global Alert Configuration with ID '{id}' has been successfully updated"
                 }
 
-            logger.debug(f"Result from update_global_application_alert_config: {result_dict}")
+            logger.debug("Result from update_global_application_alert_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_global_application_alert_config: {e}")
+            logger.error("Error in update_global_application_alert_config: %s", e)
             return {"error": f"Failed to update global application alert config: {e!s}"}
 
 
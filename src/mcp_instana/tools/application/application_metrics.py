@@ -5,8 +5,9 @@ This module provides application metrics-specific MCP tools for Instana monitori
 """
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from mcp.types import ToolAnnotations
 
@@ -24,7 +25,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp_instana.utils import (
@@ -36,6 +37,15 @@ from mcp_instana.utils import (
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Metrics requested when none are provided. Read-only, so that a call cannot change
+# the default of the later ones: each call sends its own copy.
+DEFAULT_METRICS: Tuple[Mapping[str, str], ...] = (
+    MappingProxyType({
+        "metric": "latency",
+        "aggregation": "MEAN"
+    }),
+)
+
 class ApplicationMetricsMCPTools(BaseInstanaClient):
     """Tools for application metrics in Instana MCP."""
 
@@ -75,11 +85,11 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
             Dictionary containing metrics data or error information
         """
         try:
-            logger.debug(f"get_application_data_metrics_v2 called with application_id={application_id}, service_id={service_id}, endpoint_id={endpoint_id}")
+            logger.debug("get_application_data_metrics_v2 called with application_id=%s, service_id=%s, endpoint_id=%s", application_id, service_id, endpoint_id)
 
             # Set default time range if not provided
             if not time_frame:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
                 from_time = to_time - (60 * 60 * 1000)  # Default to 1 hour
                 time_frame = {
                     "from": from_time,
@@ -88,12 +98,7 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
 
             # Set default metrics if not provided
             if not metrics:
-                metrics = [
-                    {
-                        "metric": "latency",
-                        "aggregation": "MEAN"
-                    }
-                ]
+                metrics = [dict(metric) for metric in DEFAULT_METRICS]
 
             # Create the request body
             request_body = {
@@ -124,10 +129,10 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_application_data_metrics_v2: {result_dict}")
+            logger.debug("Result from get_application_data_metrics_v2: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_application_data_metrics_v2: {e}", exc_info=True)
+            logger.error("Error in get_application_data_metrics_v2: %s", e, exc_info=True)
             return {"error": f"Failed to get application data metrics: {e!s}"}
 
     @register_as_tool(
@@ -159,11 +164,11 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
             Dictionary containing application metrics data or error information
         """
         try:
-            logger.debug(f"get_application_metrics called with application_ids={application_ids}")
+            logger.debug("get_application_metrics called with application_ids=%s", application_ids)
 
             # Set default time range if not provided
             if not time_frame:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
                 from_time = to_time - (60 * 60 * 1000)  # Default to 1 hour
                 time_frame = {
                     "from": from_time,
@@ -172,12 +177,7 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
 
             # Set default metrics if not provided
             if not metrics:
-                metrics = [
-                    {
-                        "metric": "latency",
-                        "aggregation": "MEAN"
-                    }
-                ]
+                metrics = [dict(metric) for metric in DEFAULT_METRICS]
 
             # Create the request body
             request_body = {
@@ -205,10 +205,10 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_application_metrics: {result_dict}")
+            logger.debug("Result from get_application_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_application_metrics: {e}", exc_info=True)
+            logger.error("Error in get_application_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get application metrics: {e!s}"}
 
     @register_as_tool(
@@ -240,11 +240,11 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
             Dictionary containing endpoint metrics data or error information
         """
         try:
-            logger.debug(f"get_endpoints_metrics called with endpoint_ids={endpoint_ids}")
+            logger.debug("get_endpoints_metrics called with endpoint_ids=%s", endpoint_ids)
 
             # Set default time range if not provided
             if not time_frame:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
                 from_time = to_time - (60 * 60 * 1000)  # Default to 1 hour
                 time_frame = {
                     "from": from_time,
@@ -253,12 +253,7 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
 
             # Set default metrics if not provided
             if not metrics:
-                metrics = [
-                    {
-                        "metric": "latency",
-                        "aggregation": "MEAN"
-                    }
-                ]
+                metrics = [dict(metric) for metric in DEFAULT_METRICS]
 
             # Create the request body
             request_body = {
@@ -286,10 +281,10 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_endpoints_metrics: {result_dict}")
+            logger.debug("Result from get_endpoints_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_endpoints_metrics: {e}", exc_info=True)
+            logger.error("Error in get_endpoints_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get endpoints metrics: {e!s}"}
 
     @register_as_tool(
@@ -323,11 +318,11 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
             Dictionary containing service metrics data or error information
         """
         try:
-            logger.debug(f"get_services_metrics called with service_ids={service_ids}")
+            logger.debug("get_services_metrics called with service_ids=%s", service_ids)
 
             # Set default time range if not provided
             if not time_frame:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
                 from_time = to_time - (60 * 60 * 1000)  # Default to 1 hour
                 time_frame = {
                     "from": from_time,
@@ -336,12 +331,7 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
 
             # Set default metrics if not provided
             if not metrics:
-                metrics = [
-                    {
-                        "metric": "latency",
-                        "aggregation": "MEAN"
-                    }
-                ]
+                metrics = [dict(metric) for metric in DEFAULT_METRICS]
 
             # Create the request body
             request_body = {
@@ -370,8 +360,8 @@ class ApplicationMetricsMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_services_metrics: {result_dict}")
+            logger.debug("Result from get_services_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_services_metrics: {e}", exc_info=True)
+            logger.error("Error in get_services_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get services metrics: {e!s}"}
@@ -5,7 +5,7 @@ This module provides application resources-specific MCP tools for Instana monito
 """
 
 import logging
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Optional
 
 from mcp.types import ToolAnnotations
@@ -19,7 +19,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp_instana.utils import (
@@ -74,11 +74,11 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             Dictionary containing endpoints data or error information
         """
         try:
-            logger.debug(f"get_application_endpoints called with name_filter={name_filter}")
+            logger.debug("get_application_endpoints called with name_filter=%s", name_filter)
 
             # Set default time range if not provided
             if not to_time:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
 
             if not window_size:
                 window_size = 60 * 60 * 1000  # Default to 1 hour
@@ -102,10 +102,10 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_application_endpoints: {result_dict}")
+            logger.debug("Result from get_application_endpoints: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_application_endpoints: {e}", exc_info=True)
+            logger.error("Error in get_application_endpoints: %s", e, exc_info=True)
             return {"error": f"Failed to get application endpoints: {e!s}"}
 
     @register_as_tool(
@@ -142,11 +142,11 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             Dictionary containing service labels with their IDs and summary information
         """
         try:
-            logger.debug(f"get_application_services called with name_filter={name_filter}")
+            logger.debug("get_application_services called with name_filter=%s", name_filter)
 
             # Set default time range if not provided
             if not to_time:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
 
             if not window_size:
                 window_size = 60 * 60 * 1000  # Default to 1 hour
@@ -169,7 +169,7 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_application_services: {result_dict}")
+            logger.debug("Result from get_application_services: %s", result_dict)
 
             # Extract service labels and IDs from the items
             services = []
@@ -211,7 +211,7 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             }
 
         except Exception as e:
-            logger.error(f"Error in get_application_services: {e}", exc_info=True)
+            logger.error("Error in get_application_services: %s", e, exc_info=True)
             return {"error": f"Failed to get application services: {e!s}"}
 
 
@@ -248,11 +248,11 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             List of application names
         """
         try:
-            logger.debug(f"get_applications called with name_filter={name_filter}")
+            logger.debug("get_applications called with name_filter=%s", name_filter)
 
             # Set default time range if not provided
             if not to_time:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
 
             if not window_size:
                 window_size = 60 * 60 * 1000  # Default to 1 hour
@@ -274,7 +274,7 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_applications: {result_dict}")
+            logger.debug("Result from get_applications: %s", result_dict)
 
             # Extract labels from the items
             labels = []
@@ -293,7 +293,7 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             return labels[:15]
 
         except Exception as e:
-            logger.error(f"Error in get_applications: {e}", exc_info=True)
+            logger.error("Error in get_applications: %s", e, exc_info=True)
             return [f"Error: Failed to get applications: {e!s}"]
 
 
@@ -331,11 +331,11 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             String containing service names
         """
         try:
-            logger.debug(f"get_services called with name_filter={name_filter}")
+            logger.debug("get_services called with name_filter=%s", name_filter)
 
             # Set default time range if not provided
             if not to_time:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
 
             if not window_size:
                 window_size = 60 * 60 * 1000  # Default to 1 hour
@@ -357,7 +357,7 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_services: {result_dict}")
+            logger.debug("Result from get_services: %s", result_dict)
 
             # Extract labels from the items
             labels = []
@@ -385,5 +385,5 @@ class ApplicationResourcesMCPTools(BaseInstanaClient):
             return services_text
 
         except Exception as e:
-            logger.error(f"Error in get_services: {e}", exc_info=True)
+            logger.error("Error in get_services: %s", e, exc_info=True)
             return f"Error: Failed to get services: {e!s}"
@@ -20,7 +20,6 @@ from mcp_instana.utils import (
     register_as_tool,
     with_header_auth,
 )
-from src.core.utils import BaseInstanaClient, register_as_tool, with_header_auth
 
 logger = logging.getLogger(__name__)
 
@@ -200,7 +199,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -216,10 +215,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -233,16 +232,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported NewApplicationConfig")
             except ImportError as e:
-                logger.debug(f"Error importing NewApplicationConfig: {e}")
+                logger.debug("Error importing NewApplicationConfig: %s", e)
                 return {"error": f"Failed to import NewApplicationConfig: {e!s}"}
 
             # Create an NewApplicationConfig object from the request body
             try:
-                logger.debug(f"Creating NewApplicationConfig with params: {request_body}")
+                logger.debug("Creating NewApplicationConfig with params: %s", request_body)
                 config_object = NewApplicationConfig(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating NewApplicationConfig: {e}")
+                logger.debug("Error creating NewApplicationConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the add_application_config method from the SDK
@@ -261,10 +260,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "Create new application config"
                 }
 
-            logger.debug(f"Result from add_application_config: {result_dict}")
+            logger.debug("Result from add_application_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in add_application_config: {e}")
+            logger.error("Error in add_application_config: %s", e)
             return {"error": f"Failed to add new application config: {e!s}"}
 
     @register_as_tool(
@@ -434,7 +433,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -450,10 +449,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -467,16 +466,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ApplicationConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ApplicationConfig: {e}")
+                logger.debug("Error importing ApplicationConfig: %s", e)
                 return {"error": f"Failed to import ApplicationConfig: {e!s}"}
 
             # Create an ApplicationConfig object from the request body
             try:
-                logger.debug(f"Creating ApplicationConfig with params: {request_body}")
+                logger.debug("Creating ApplicationConfig with params: %s", request_body)
                 config_object = ApplicationConfig(**request_body)
                 logger.debug("Successfully updated application config object")
             except Exception as e:
-                logger.debug(f"Error updating ApplicationConfig: {e}")
+                logger.debug("Error updating ApplicationConfig: %s", e)
                 return {"error": f"Failed to update config object: {e!s}"}
 
             # Call the put_application_config method from the SDK
@@ -496,10 +495,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "Update existing application config"
                 }
 
-            logger.debug(f"Result from put_application_config: {result_dict}")
+            logger.debug("Result from put_application_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in put_application_config: {e}")
+            logger.error("Error in put_application_config: %s", e)
             return {"error": f"Failed to update existing application config: {e!s}"}
 
     @register_as_tool(
@@ -576,7 +575,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -592,10 +591,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -609,16 +608,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported EndpointConfig")
             except ImportError as e:
-                logger.debug(f"Error importing EndpointConfig: {e}")
+                logger.debug("Error importing EndpointConfig: %s", e)
                 return {"error": f"Failed to import EndpointConfig: {e!s}"}
 
             # Create an EndpointConfig object from the request body
             try:
-                logger.debug(f"Creating EndpointConfig with params: {request_body}")
+                logger.debug("Creating EndpointConfig with params: %s", request_body)
                 config_object = EndpointConfig(**request_body)
                 logger.debug("Successfully created endpoint config object")
             except Exception as e:
-                logger.debug(f"Error creating EndpointConfig: {e}")
+                logger.debug("Error creating EndpointConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the create_endpoint_config method from the SDK
@@ -636,10 +635,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "Create new endpoint config"
                 }
 
-            logger.debug(f"Result from create_endpoint_config: {result_dict}")
+            logger.debug("Result from create_endpoint_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in create_endpoint_config: {e}")
+            logger.error("Error in create_endpoint_config: %s", e)
             return {"error": f"Failed to create new endpoint config: {e!s}"}
 
     @register_as_tool(
@@ -786,7 +785,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -802,10 +801,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -819,16 +818,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported EndpointConfig")
             except ImportError as e:
-                logger.debug(f"Error importing EndpointConfig: {e}")
+                logger.debug("Error importing EndpointConfig: %s", e)
                 return {"error": f"Failed to import EndpointConfig: {e!s}"}
 
             # Create an EndpointConfig object from the request body
             try:
-                logger.debug(f"Creating EndpointConfig with params: {request_body}")
+                logger.debug("Creating EndpointConfig with params: %s", request_body)
                 config_object = EndpointConfig(**request_body)
                 logger.debug("Successfully updated endpoint config object")
             except Exception as e:
-                logger.debug(f"Error updating EndpointConfig: {e}")
+                logger.debug("Error updating EndpointConfig: %s", e)
                 return {"error": f"Failed to update config object: {e!s}"}
 
             # Call the update_endpoint_config method from the SDK
@@ -848,10 +847,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "update existing endpoint config"
                 }
 
-            logger.debug(f"Result from update_endpoint_config: {result_dict}")
+            logger.debug("Result from update_endpoint_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_endpoint_config: {e}")
+            logger.error("Error in update_endpoint_config: %s", e)
             return {"error": f"Failed to update existing application config: {e!s}"}
 
 
@@ -943,7 +942,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -959,10 +958,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -976,16 +975,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported NewManualServiceConfig")
             except ImportError as e:
-                logger.debug(f"Error importing NewManualServiceConfig: {e}")
+                logger.debug("Error importing NewManualServiceConfig: %s", e)
                 return {"error": f"Failed to import NewManualServiceConfig: {e!s}"}
 
             # Create an NewManualServiceConfig object from the request body
             try:
-                logger.debug(f"Creating NewManualServiceConfig with params: {request_body}")
+                logger.debug("Creating NewManualServiceConfig with params: %s", request_body)
                 config_object = NewManualServiceConfig(**request_body)
                 logger.debug("Successfully created manual service config object")
             except Exception as e:
-                logger.debug(f"Error creating NewManualServiceConfig: {e}")
+                logger.debug("Error creating NewManualServiceConfig: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the add_manual_service_config method from the SDK
@@ -1004,10 +1003,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "Create new manual service config"
                 }
 
-            logger.debug(f"Result from add_manual_service_config: {result_dict}")
+            logger.debug("Result from add_manual_service_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in add_manual_service_config: {e}")
+            logger.error("Error in add_manual_service_config: %s", e)
             return {"error": f"Failed to create new manual service config: {e!s}"}
 
     @register_as_tool(
@@ -1109,7 +1108,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -1125,10 +1124,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -1142,16 +1141,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ManualServiceConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ManualServiceConfig: {e}")
+                logger.debug("Error importing ManualServiceConfig: %s", e)
                 return {"error": f"Failed to import ManualServiceConfig: {e!s}"}
 
             # Create an ManualServiceConfig object from the request body
             try:
-                logger.debug(f"Creating ManualServiceConfig with params: {request_body}")
+                logger.debug("Creating ManualServiceConfig with params: %s", request_body)
                 config_object = ManualServiceConfig(**request_body)
                 logger.debug("Successfully update manual service config object")
             except Exception as e:
-                logger.debug(f"Error creating ManualServiceConfig: {e}")
+                logger.debug("Error creating ManualServiceConfig: %s", e)
                 return {"error": f"Failed to update manual config object: {e!s}"}
 
             # Call the update_manual_service_config method from the SDK
@@ -1171,10 +1170,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "update manual service config"
                 }
 
-            logger.debug(f"Result from update_manual_service_config: {result_dict}")
+            logger.debug("Result from update_manual_service_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_manual_service_config: {e}")
+            logger.error("Error in update_manual_service_config: %s", e)
             return {"error": f"Failed to update manual config: {e!s}"}
 
 
@@ -1236,7 +1235,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -1252,10 +1251,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return [{"error": f"Invalid payload format: {e2}", "payload": payload}]
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return [{"error": f"Failed to parse payload: {e}", "payload": payload}]
             else:
                 # If payload is already a dictionary, use it directly
@@ -1269,16 +1268,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ManualServiceConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ManualServiceConfig: {e}")
+                logger.debug("Error importing ManualServiceConfig: %s", e)
                 return [{"error": f"Failed to import ManualServiceConfig: {e!s}"}]
 
             # Create an ManualServiceConfig object from the request body
             try:
-                logger.debug(f"Creating ManualServiceConfig with params: {request_body}")
+                logger.debug("Creating ManualServiceConfig with params: %s", request_body)
                 config_object = [NewManualServiceConfig(**request_body)]
                 logger.debug("Successfully replace all manual service config object")
             except Exception as e:
-                logger.debug(f"Error creating ManualServiceConfig: {e}")
+                logger.debug("Error creating ManualServiceConfig: %s", e)
                 return [{"error": f"Failed to replace all manual config object: {e!s}"}]
 
             # Call the replace_all_manual_service_config method from the SDK
@@ -1297,10 +1296,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "Create replace all manual service config"
                 }
 
-            logger.debug(f"Result from replace_all_manual_service_config: {result_dict}")
+            logger.debug("Result from replace_all_manual_service_config: %s", result_dict)
             return [result_dict]
         except Exception as e:
-            logger.error(f"Error in replace_all_manual_service_config: {e}")
+            logger.error("Error in replace_all_manual_service_config: %s", e)
             return [{"error": f"Failed to replace all manual config: {e!s}"}]
 
     @register_as_tool(
@@ -1386,7 +1385,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -1402,10 +1401,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -1419,16 +1418,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ServiceConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ServiceConfig: {e}")
+                logger.debug("Error importing ServiceConfig: %s", e)
                 return {"error": f"Failed to import ServiceConfig: {e!s}"}
 
             # Create an ServiceConfig object from the request body
             try:
-                logger.debug(f"Creating ServiceConfig with params: {request_body}")
+                logger.debug("Creating ServiceConfig with params: %s", request_body)
                 config_object = ServiceConfig(**request_body)
                 logger.debug("Successfully add service config object")
             except Exception as e:
-                logger.debug(f"Error creating ServiceConfig: {e}")
+                logger.debug("Error creating ServiceConfig: %s", e)
                 return {"error": f"Failed to add service config object: {e!s}"}
 
             # Call the ServiceConfig method from the SDK
@@ -1447,10 +1446,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "Create service config"
                 }
 
-            logger.debug(f"Result from add_service_config: {result_dict}")
+            logger.debug("Result from add_service_config: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in add_service_config: {e}")
+            logger.error("Error in add_service_config: %s", e)
             return {"error": f"Failed to add service config: {e!s}"}
 
     @register_as_tool(
@@ -1498,7 +1497,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -1514,10 +1513,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return [{"error": f"Invalid payload format: {e2}", "payload": payload}]
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return [{"error": f"Failed to parse payload: {e}", "payload": payload}]
             else:
                 # If payload is already a dictionary, use it directly
@@ -1531,16 +1530,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ServiceConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ServiceConfig: {e}")
+                logger.debug("Error importing ServiceConfig: %s", e)
                 return [{"error": f"Failed to import ServiceConfig: {e!s}"}]
 
             # Create an ServiceConfig object from the request body
             try:
-                logger.debug(f"Creating ServiceConfig with params: {request_body}")
+                logger.debug("Creating ServiceConfig with params: %s", request_body)
                 config_object = [ServiceConfig(**request_body)]
                 logger.debug("Successfully replace all manual service config object")
             except Exception as e:
-                logger.debug(f"Error creating ServiceConfig: {e}")
+                logger.debug("Error creating ServiceConfig: %s", e)
                 return [{"error": f"Failed to replace all manual config object: {e!s}"}]
 
             # Call the replace_all method from the SDK
@@ -1559,10 +1558,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "replace all service config"
                 }
 
-            logger.debug(f"Result from replace_all: {result_dict}")
+            logger.debug("Result from replace_all: %s", result_dict)
             return [result_dict]
         except Exception as e:
-            logger.error(f"Error in replace_all: {e}")
+            logger.error("Error in replace_all: %s", e)
             return [{"error": f"Failed to replace all service config: {e!s}"}]
 
 
@@ -1741,7 +1740,7 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -1757,10 +1756,10 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return [{"error": f"Invalid payload format: {e2}", "payload": payload}]
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return [{"error": f"Failed to parse payload: {e}", "payload": payload}]
             else:
                 # If payload is already a dictionary, use it directly
@@ -1774,16 +1773,16 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ServiceConfig")
             except ImportError as e:
-                logger.debug(f"Error importing ServiceConfig: {e}")
+                logger.debug("Error importing ServiceConfig: %s", e)
                 return [{"error": f"Failed to import ServiceConfig: {e!s}"}]
 
             # Create an ServiceConfig object from the request body
             try:
-                logger.debug(f"Creating ServiceConfig with params: {request_body}")
+                logger.debug("Creating ServiceConfig with params: %s", request_body)
                 config_object = [ServiceConfig(**request_body)]
                 logger.debug("Successfully update service config object")
             except Exception as e:
-                logger.debug(f"Error creating ServiceConfig: {e}")
+                logger.debug("Error creating ServiceConfig: %s", e)
                 return [{"error": f"Failed to replace all manual config object: {e!s}"}]
 
             # Call the put_service_config method from the SDK
@@ -1803,9 +1802,9 @@ class ApplicationSettingsMCPTools(BaseInstanaClient):
                     "message": "put service config"
                 }
 
-            logger.debug(f"Result from put_service_config: {result_dict}")
+            logger.debug("Result from put_service_config: %s", result_dict)
             return [result_dict]
         except Exception as e:
-            logger.error(f"Error in put_service_config: {e}")
+            logger.error("Error in put_service_config: %s", e)
             return [{"error": f"Failed to update service config: {e!s}"}]
 
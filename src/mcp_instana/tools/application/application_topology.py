@@ -5,7 +5,7 @@ This module provides application topology-specific MCP tools for Instana monitor
 """
 
 import logging
-from datetime import datetime
+import time
 from typing import Any, Dict, Optional
 
 from mcp.types import ToolAnnotations
@@ -22,7 +22,7 @@ except ImportError as e:
     import logging
     import traceback
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}")
+    logger.error("Error importing Instana SDK: %s", e)
     traceback.print_exc()
     raise
 
@@ -51,7 +51,7 @@ class ApplicationTopologyMCPTools(BaseInstanaClient):
             self.topology_api = ApplicationTopologyApi(api_client=api_client)
 
         except Exception as e:
-            logger.error(f"Error initializing ApplicationTopologyMCPTools: {e}", exc_info=True)
+            logger.error("Error initializing ApplicationTopologyMCPTools: %s", e, exc_info=True)
             raise
 
     @register_as_tool(
@@ -84,7 +84,7 @@ class ApplicationTopologyMCPTools(BaseInstanaClient):
 
             # Set default values if not provided
             if not to_timestamp:
-                to_timestamp = int(datetime.now().timestamp() * 1000)
+                to_timestamp = time.time_ns() // 1_000_000
 
             if not window_size:
                 window_size = 3600000  # Default to 1 hour in milliseconds
@@ -114,5 +114,5 @@ class ApplicationTopologyMCPTools(BaseInstanaClient):
                 return {"error": error_message}
 
         except Exception as e:
-            logger.error(f"Error in get_application_topology: {e}", exc_info=True)
+            logger.error("Error in get_application_topology: %s", e, exc_info=True)
             return {"error": f"Failed to get application topology: {e!s}"}
@@ -74,7 +74,7 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -90,10 +90,10 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -104,7 +104,7 @@ class ActionCatalogMCPTools(BaseInstanaClient):
             required_fields = ["name"]
             for field in required_fields:
                 if field not in request_body:
-                    logger.warning(f"Missing required field: {field}")
+                    logger.warning("Missing required field: %s", field)
                     return {"error": f"Missing required field: {field}"}
 
             # Import the ActionSearchSpace class
@@ -114,16 +114,16 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ActionSearchSpace")
             except ImportError as e:
-                logger.debug(f"Error importing ActionSearchSpace: {e}")
+                logger.debug("Error importing ActionSearchSpace: %s", e)
                 return {"error": f"Failed to import ActionSearchSpace: {e!s}"}
 
             # Create an ActionSearchSpace object from the request body
             try:
-                logger.debug(f"Creating ActionSearchSpace with params: {request_body}")
+                logger.debug("Creating ActionSearchSpace with params: %s", request_body)
                 config_object = ActionSearchSpace(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating ActionSearchSpace: {e}")
+                logger.debug("Error creating ActionSearchSpace: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the get_action_matches_without_preload_content method from the SDK to avoid Pydantic validation issues
@@ -144,7 +144,7 @@ class ActionCatalogMCPTools(BaseInstanaClient):
 
                 # Handle the parsed JSON data
                 if isinstance(result_dict, list):
-                    logger.debug(f"Result from get_action_matches: {result_dict}")
+                    logger.debug("Result from get_action_matches: %s", result_dict)
                     return {
                         "success": True,
                         "message": "Action matches retrieved successfully",
@@ -152,7 +152,7 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                         "count": len(result_dict)
                     }
                 else:
-                    logger.debug(f"Result from get_action_matches: {result_dict}")
+                    logger.debug("Result from get_action_matches: %s", result_dict)
                     return {
                         "success": True,
                         "message": "Action match retrieved successfully",
@@ -163,7 +163,7 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                 logger.error(error_message)
                 return {"error": error_message}
         except Exception as e:
-            logger.error(f"Error in get_action_matches: {e}")
+            logger.error("Error in get_action_matches: %s", e)
             return {"error": f"Failed to get action matches: {e!s}"}
 
     @register_as_tool(
@@ -208,18 +208,18 @@ class ActionCatalogMCPTools(BaseInstanaClient):
             # Handle the case where the API returns a list directly
             if isinstance(result_dict, list):
                 # Return the list directly
-                logger.debug(f"Result from get_actions: {result_dict}")
+                logger.debug("Result from get_actions: %s", result_dict)
                 return result_dict
             elif isinstance(result_dict, dict) and "actions" in result_dict:
-                logger.debug(f"Result from get_actions: {result_dict['actions']}")
+                logger.debug("Result from get_actions: %s", result_dict['actions'])
                 return result_dict["actions"]
             else:
                 # Return as is if it's already a list or other format
-                logger.debug(f"Result from get_actions: {result_dict}")
+                logger.debug("Result from get_actions: %s", result_dict)
                 return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_actions: {e}")
+            logger.error("Error in get_actions: %s", e)
             return {"error": f"Failed to get actions: {e!s}"}
 
     @register_as_tool(
@@ -246,7 +246,7 @@ class ActionCatalogMCPTools(BaseInstanaClient):
             if not action_id:
                 return {"error": "action_id is required"}
 
-            logger.debug(f"get_action_details called with action_id: {action_id}")
+            logger.debug("get_action_details called with action_id: %s", action_id)
 
             # Call the get_action_by_id_without_preload_content method from the SDK to avoid Pydantic validation issues
             result = api_client.get_action_by_id_without_preload_content(id=action_id)
@@ -264,11 +264,11 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                 logger.error(error_message)
                 return {"error": error_message}
 
-            logger.debug(f"Result from get_action: {result_dict}")
+            logger.debug("Result from get_action: %s", result_dict)
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_action_details: {e}")
+            logger.error("Error in get_action_details: %s", e)
             return {"error": f"Failed to get action details: {e!s}"}
 
     @register_as_tool(
@@ -320,11 +320,11 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                 logger.error(error_message)
                 return {"error": error_message}
 
-            logger.debug(f"Result from get_action_types: {result_dict}")
+            logger.debug("Result from get_action_types: %s", result_dict)
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_action_types: {e}")
+            logger.error("Error in get_action_types: %s", e)
             return {"error": f"Failed to get action types: {e!s}"}
 
     @register_as_tool(
@@ -388,9 +388,9 @@ class ActionCatalogMCPTools(BaseInstanaClient):
                 logger.error(error_message)
                 return {"error": error_message}
 
-            logger.debug(f"Result from get_action_tags: {result_dict}")
+            logger.debug("Result from get_action_tags: %s", result_dict)
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_action_tags: {e}")
+            logger.error("Error in get_action_tags: %s", e)
             return {"error": f"Failed to get action tags: {e!s}"}
@@ -8,8 +8,7 @@ import logging
 from typing import Any, Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
-
-from src.core.utils import BaseInstanaClient, register_as_tool, with_header_auth
+from mcp_instana.utils import BaseInstanaClient, register_as_tool, with_header_auth
 
 # Import the necessary classes from the SDK
 try:
@@ -101,7 +100,7 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -117,10 +116,10 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -131,7 +130,7 @@ class ActionHistoryMCPTools(BaseInstanaClient):
             required_fields = ["actionId", "hostId"]
             for field in required_fields:
                 if field not in request_body:
-                    logger.warning(f"Missing required field: {field}")
+                    logger.warning("Missing required field: %s", field)
                     return {"error": f"Missing required field: {field}"}
 
             # Import the ActionInstanceRequest class
@@ -141,16 +140,16 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported ActionInstanceRequest")
             except ImportError as e:
-                logger.debug(f"Error importing ActionInstanceRequest: {e}")
+                logger.debug("Error importing ActionInstanceRequest: %s", e)
                 return {"error": f"Failed to import ActionInstanceRequest: {e!s}"}
 
             # Create an ActionInstanceRequest object from the request body
             try:
-                logger.debug(f"Creating ActionInstanceRequest with params: {request_body}")
+                logger.debug("Creating ActionInstanceRequest with params: %s", request_body)
                 config_object = ActionInstanceRequest(**request_body)
                 logger.debug("Successfully created config object")
             except Exception as e:
-                logger.debug(f"Error creating ActionInstanceRequest: {e}")
+                logger.debug("Error creating ActionInstanceRequest: %s", e)
                 return {"error": f"Failed to create config object: {e!s}"}
 
             # Call the add_action_instance method from the SDK
@@ -169,10 +168,10 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                     "message": "Automation action submitted successfully"
                 }
 
-            logger.debug(f"Result from add_action_instance: {result_dict}")
+            logger.debug("Result from add_action_instance: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in submit_automation_action: {e}")
+            logger.error("Error in submit_automation_action: %s", e)
             return {"error": f"Failed to submit automation action: {e!s}"}
 
     @register_as_tool(
@@ -203,7 +202,7 @@ class ActionHistoryMCPTools(BaseInstanaClient):
             if not action_instance_id:
                 return {"error": "action_instance_id is required"}
 
-            logger.debug(f"Getting action instance details for ID: {action_instance_id}")
+            logger.debug("Getting action instance details for ID: %s", action_instance_id)
             result = api_client.get_action_instance(
                 action_instance_id=action_instance_id,
                 window_size=window_size,
@@ -220,10 +219,10 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                     "message": "Action instance details retrieved successfully"
                 }
 
-            logger.debug(f"Result from get_action_instance: {result_dict}")
+            logger.debug("Result from get_action_instance: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_action_instance_details: {e}")
+            logger.error("Error in get_action_instance_details: %s", e)
             return {"error": f"Failed to get action instance details: {e!s}"}
 
     @register_as_tool(
@@ -296,10 +295,10 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                     "message": "Action instances retrieved successfully"
                 }
 
-            logger.debug(f"Result from get_action_instances: {result_dict}")
+            logger.debug("Result from get_action_instances: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in list_action_instances: {e}")
+            logger.error("Error in list_action_instances: %s", e)
             return {"error": f"Failed to list action instances: {e!s}"}
 
     @register_as_tool(
@@ -334,7 +333,7 @@ class ActionHistoryMCPTools(BaseInstanaClient):
             if not to_time:
                 return {"error": "to_time is required"}
 
-            logger.debug(f"Deleting action instance with ID: {action_instance_id}")
+            logger.debug("Deleting action instance with ID: %s", action_instance_id)
             result = api_client.delete_action_instance(
                 action_instance_id=action_instance_id,
                 var_from=from_time,
@@ -351,8 +350,8 @@ class ActionHistoryMCPTools(BaseInstanaClient):
                     "message": "Action instance deleted successfully"
                 }
 
-            logger.debug(f"Result from delete_action_instance: {result_dict}")
+            logger.debug("Result from delete_action_instance: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in delete_action_instance: {e}")
+            logger.error("Error in delete_action_instance: %s", e)
             return {"error": f"Failed to delete action instance: {e!s}"}
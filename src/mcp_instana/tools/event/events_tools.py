@@ -8,6 +8,7 @@ This module provides agent monitoring events-specific MCP tools for Instana moni
 import json
 import logging
 import re
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
@@ -53,11 +54,11 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             Tuple of (from_time, to_time) in milliseconds
         """
         # Current time in milliseconds
-        current_time_ms = int(datetime.now().timestamp() * 1000)
+        current_time_ms = time.time_ns() // 1_000_000
 
         # Process natural language time range if provided
         if time_range:
-            logger.debug(f"Processing natural language time range: '{time_range}'")
+            logger.debug("Processing natural language time range: '%s'", time_range)
 
             # Default to 24 hours if just "last few hours" is specified
             if time_range.lower() in ["last few hours", "last hours", "few hours"]:
@@ -184,7 +185,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             Dictionary containing the event data or error information
         """
         try:
-            logger.debug(f"get_event called with event_id={event_id}")
+            logger.debug("get_event called with event_id=%s", event_id)
 
             if not event_id:
                 return {"error": "event_id parameter is required"}
@@ -202,7 +203,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     # Convert to dictionary using __dict__ or as a fallback, create a new dict with string representation
                     result_dict = getattr(result, "__dict__", {"data": str(result)})
 
-                logger.debug(f"Successfully retrieved event with ID {event_id}")
+                logger.debug("Successfully retrieved event with ID %s", event_id)
                 return result_dict
 
             except Exception as api_error:
@@ -214,7 +215,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                         return {"error": "Authentication failed. Please check your API token and permissions."}
 
                 # Try fallback approach
-                logger.warning(f"Standard API call failed: {api_error}, trying fallback approach")
+                logger.warning("Standard API call failed: %s, trying fallback approach", api_error)
 
                 # Use the without_preload_content version to get the raw response
                 try:
@@ -232,7 +233,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     # Parse the JSON manually
                     try:
                         result_dict = json.loads(response_text)
-                        logger.debug(f"Successfully retrieved event with ID {event_id} using fallback")
+                        logger.debug("Successfully retrieved event with ID %s using fallback", event_id)
                         return result_dict
                     except json.JSONDecodeError as json_err:
                         error_message = f"Failed to parse JSON response: {json_err}"
@@ -240,11 +241,11 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                         return {"error": error_message, "event_id": event_id}
 
                 except Exception as fallback_error:
-                    logger.error(f"Fallback approach failed: {fallback_error}")
+                    logger.error("Fallback approach failed: %s", fallback_error)
                     raise
 
         except Exception as e:
-            logger.error(f"Error in get_event: {e}", exc_info=True)
+            logger.error("Error in get_event: %s", e, exc_info=True)
             return {"error": f"Failed to get event: {e!s}", "event_id": event_id}
 
     @register_as_tool(
@@ -281,7 +282,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             Dictionary containing detailed Kubernetes events analysis or error information
         """
         try:
-            logger.debug(f"get_kubernetes_info_events called with time_range={time_range}, from_time={from_time}, to_time={to_time}, max_events={max_events}")
+            logger.debug("get_kubernetes_info_events called with time_range=%s, from_time=%s, to_time=%s, max_events=%s", time_range, from_time, to_time, max_events)
             from_time, to_time = self._process_time_range(time_range, from_time, to_time)
             from_date = datetime.fromtimestamp(from_time/1000).strftime('%Y-%m-%d %H:%M:%S')
             to_date = datetime.fromtimestamp(to_time/1000).strftime('%Y-%m-%d %H:%M:%S')
@@ -293,10 +294,10 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     filter_event_updates=None,
                     exclude_triggered_before=None
                 )
-                logger.debug(f"Raw API result type: {type(result)}")
-                logger.debug(f"Raw API result length: {len(result) if isinstance(result, list) else 'not a list'}")
+                logger.debug("Raw API result type: %s", type(result))
+                logger.debug("Raw API result length: %s", len(result) if isinstance(result, list) else 'not a list')
             except Exception as api_error:
-                logger.error(f"API call failed: {api_error}", exc_info=True)
+                logger.error("API call failed: %s", api_error, exc_info=True)
                 return {
                     "error": f"Failed to get Kubernetes info events: {api_error}",
                     "details": str(api_error)
@@ -389,7 +390,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             analysis_result["events"] = event_dicts
             return analysis_result
         except Exception as e:
-            logger.error(f"Error in get_kubernetes_info_events: {e}", exc_info=True)
+            logger.error("Error in get_kubernetes_info_events: %s", e, exc_info=True)
             return {
                 "error": f"Failed to get Kubernetes info events: {e!s}",
                 "details": str(e)
@@ -433,7 +434,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             Dictionary containing summarized agent monitoring events data or error information
         """
         try:
-            logger.debug(f"get_agent_monitoring_events called with query={query}, time_range={time_range}, from_time={from_time}, to_time={to_time}, size={size}")
+            logger.debug("get_agent_monitoring_events called with query=%s, time_range=%s, from_time=%s, to_time=%s, size=%s", query, time_range, from_time, to_time, size)
             from_time, to_time = self._process_time_range(time_range, from_time, to_time)
             if not from_time:
                 from_time = to_time - (60 * 60 * 1000)
@@ -447,10 +448,10 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     filter_event_updates=None,
                     exclude_triggered_before=None
                 )
-                logger.debug(f"Raw API result type: {type(result)}")
-                logger.debug(f"Raw API result length: {len(result) if isinstance(result, list) else 'not a list'}")
+                logger.debug("Raw API result type: %s", type(result))
+                logger.debug("Raw API result length: %s", len(result) if isinstance(result, list) else 'not a list')
             except Exception as api_error:
-                logger.error(f"API call failed: {api_error}", exc_info=True)
+                logger.error("API call failed: %s", api_error, exc_info=True)
                 return {
                     "error": f"Failed to get agent monitoring events: {api_error}",
                     "details": str(api_error)
@@ -533,7 +534,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             analysis_result["events"] = event_dicts
             return analysis_result
         except Exception as e:
-            logger.error(f"Error in get_agent_monitoring_events: {e}", exc_info=True)
+            logger.error("Error in get_agent_monitoring_events: %s", e, exc_info=True)
             return {
                 "error": f"Failed to get agent monitoring events: {e!s}",
                 "details": str(e)
@@ -582,7 +583,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
         """
 
         try:
-            logger.debug(f"get_issue_events called with query={query}, time_range={time_range}, from_time={from_time}, to_time={to_time}, size={size}")
+            logger.debug("get_issue_events called with query=%s, time_range=%s, from_time=%s, to_time=%s, size=%s", query, time_range, from_time, to_time, size)
             from_time, to_time = self._process_time_range(time_range, from_time, to_time)
             if not from_time:
                 from_time = to_time - (60 * 60 * 1000)
@@ -605,10 +606,10 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     result_dict = result
                 return result_dict
             except Exception as api_error:
-                logger.error(f"API call failed: {api_error}", exc_info=True)
+                logger.error("API call failed: %s", api_error, exc_info=True)
                 return {"error": f"Failed to get issue events: {api_error}"}
         except Exception as e:
-            logger.error(f"Error in get_issue_events: {e}", exc_info=True)
+            logger.error("Error in get_issue_events: %s", e, exc_info=True)
             return {"error": f"Failed to get issue events: {e!s}"}
 
     @register_as_tool(
@@ -653,7 +654,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
         """
 
         try:
-            logger.debug(f"get_incident_events called with query={query}, time_range={time_range}, from_time={from_time}, to_time={to_time}, size={size}")
+            logger.debug("get_incident_events called with query=%s, time_range=%s, from_time=%s, to_time=%s, size=%s", query, time_range, from_time, to_time, size)
             from_time, to_time = self._process_time_range(time_range, from_time, to_time)
             if not from_time:
                 from_time = to_time - (60 * 60 * 1000)
@@ -676,10 +677,10 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     result_dict = result
                 return result_dict
             except Exception as api_error:
-                logger.error(f"API call failed: {api_error}", exc_info=True)
+                logger.error("API call failed: %s", api_error, exc_info=True)
                 return {"error": f"Failed to get incident events: {api_error}"}
         except Exception as e:
-            logger.error(f"Error in get_incident_events: {e}", exc_info=True)
+            logger.error("Error in get_incident_events: %s", e, exc_info=True)
             return {"error": f"Failed to get incident events: {e!s}"}
 
     @register_as_tool(
@@ -724,7 +725,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
         """
 
         try:
-            logger.debug(f"get_change_events called with query={query}, time_range={time_range}, from_time={from_time}, to_time={to_time}, size={size}")
+            logger.debug("get_change_events called with query=%s, time_range=%s, from_time=%s, to_time=%s, size=%s", query, time_range, from_time, to_time, size)
             from_time, to_time = self._process_time_range(time_range, from_time, to_time)
             if not from_time:
                 from_time = to_time - (60 * 60 * 1000)
@@ -747,10 +748,10 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     result_dict = result
                 return result_dict
             except Exception as api_error:
-                logger.error(f"API call failed: {api_error}", exc_info=True)
+                logger.error("API call failed: %s", api_error, exc_info=True)
                 return {"error": f"Failed to get change events: {api_error}"}
         except Exception as e:
-            logger.error(f"Error in get_change_events: {e}", exc_info=True)
+            logger.error("Error in get_change_events: %s", e, exc_info=True)
             return {"error": f"Failed to get change events: {e!s}"}
 
     @register_as_tool(
@@ -781,7 +782,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
         """
 
         try:
-            logger.debug(f"get_events_by_ids called with event_ids={event_ids}")
+            logger.debug("get_events_by_ids called with event_ids=%s", event_ids)
 
             # Handle string input conversion
             if isinstance(event_ids, str):
@@ -790,7 +791,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     try:
                         event_ids = ast.literal_eval(event_ids)
                     except (SyntaxError, ValueError) as e:
-                        logger.error(f"Failed to parse event_ids as list: {e}")
+                        logger.error("Failed to parse event_ids as list: %s", e)
                         return {"error": f"Invalid event_ids format: {e}"}
                 else:
                     event_ids = [id.strip() for id in event_ids.split(',')]
@@ -799,7 +800,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
             if not event_ids:
                 return {"error": "No event IDs provided"}
 
-            logger.debug(f"Processing {len(event_ids)} event IDs")
+            logger.debug("Processing %s event IDs", len(event_ids))
 
             # Use the batch API to retrieve all events at once
             try:
@@ -822,17 +823,17 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     "summary": self._summarize_events_result(all_events)
                 }
 
-                logger.debug(f"Retrieved {result['successful_retrievals']} events successfully using batch API")
+                logger.debug("Retrieved %s events successfully using batch API", result['successful_retrievals'])
                 return result
 
             except Exception as batch_error:
-                logger.warning(f"Batch API failed: {batch_error}. Falling back to individual requests.")
+                logger.warning("Batch API failed: %s. Falling back to individual requests.", batch_error)
 
                 # Fallback to individual requests using without_preload_content
                 all_events = []
                 for event_id in event_ids:
                     try:
-                        logger.debug(f"Retrieving event ID: {event_id}")
+                        logger.debug("Retrieving event ID: %s", event_id)
                         response_data = api_client.get_events_by_ids_without_preload_content(request_body=[event_id])
 
                         # Check if the response was successful
@@ -856,7 +857,7 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                             all_events.append({"eventId": event_id, "error": error_message})
 
                     except Exception as e:
-                        logger.error(f"Error retrieving event ID {event_id}: {e}", exc_info=True)
+                        logger.error("Error retrieving event ID %s: %s", event_id, e, exc_info=True)
                         all_events.append({"eventId": event_id, "error": f"Failed to retrieve: {e!s}"})
 
                 result = {
@@ -867,10 +868,10 @@ class AgentMonitoringEventsMCPTools(BaseInstanaClient):
                     "summary": self._summarize_events_result([e for e in all_events if "error" not in e])
                 }
 
-                logger.debug(f"Retrieved {result['successful_retrievals']} events successfully, {result['failed_retrievals']} failed using individual requests")
+                logger.debug("Retrieved %s events successfully, %s failed using individual requests", result['successful_retrievals'], result['failed_retrievals'])
                 return result
         except Exception as e:
-            logger.error(f"Error in get_events_by_ids: {e}", exc_info=True)
+            logger.error("Error in get_events_by_ids: %s", e, exc_info=True)
             return {
                 "error": f"Failed to get events by IDs: {e!s}",
                 "details": str(e)
@@ -30,7 +30,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp.types import ToolAnnotations
@@ -94,7 +94,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
             Dictionary containing available metrics or error information
         """
         try:
-            logger.debug(f"get_available_metrics called with payload={payload}")
+            logger.debug("get_available_metrics called with payload=%s", payload)
 
             # If payload is a string, try to parse it as JSON
             if isinstance(payload, str):
@@ -106,7 +106,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.error(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.error("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -122,17 +122,17 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.error(f"Failed to parse payload string: {e2}")
+                                logger.error("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.error(f"Error parsing payload string: {e}")
+                    logger.error("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
                 logger.debug("Using provided payload dictionary")
                 request_body = payload
 
-            logger.debug(f"Final request body: {request_body}")
+            logger.debug("Final request body: %s", request_body)
 
             # Import the GetAvailableMetricsQuery class
             try:
@@ -171,11 +171,11 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 if request_body and "tagFilterExpression" in request_body:
                     query_params["tagFilterExpression"] = request_body["tagFilterExpression"]
 
-                logger.debug(f"Creating GetAvailableMetricsQuery with params: {query_params}")
+                logger.debug("Creating GetAvailableMetricsQuery with params: %s", query_params)
                 query_object = GetAvailableMetricsQuery(**query_params)
-                logger.debug(f"Successfully created query object: {query_object}")
+                logger.debug("Successfully created query object: %s", query_object)
             except Exception as e:
-                logger.error(f"Error creating GetAvailableMetricsQuery: {e}")
+                logger.error("Error creating GetAvailableMetricsQuery: %s", e)
                 return {"error": f"Failed to create query object: {e!s}"}
 
             # Call the get_available_metrics method from the SDK with the query object
@@ -189,10 +189,10 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_available_metrics: {result_dict}")
+            logger.debug("Result from get_available_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_available_metrics: {e}", exc_info=True)
+            logger.error("Error in get_available_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get available metrics: {e!s}"}
 
     @register_as_tool(
@@ -244,7 +244,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
             Dictionary containing infrastructure entities and their metrics or error information
         """
         try:
-            logger.debug(f"get_entities called with payload={payload}")
+            logger.debug("get_entities called with payload=%s", payload)
 
             # If payload is a string, try to parse it as JSON
             if isinstance(payload, str):
@@ -256,7 +256,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.warning(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.warning("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -272,17 +272,17 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.error(f"Failed to parse payload string: {e2}")
+                                logger.error("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.error(f"Error parsing payload string: {e}")
+                    logger.error("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
                 logger.debug("Using provided payload dictionary")
                 request_body = payload
 
-            logger.debug(f"Final request body: {request_body}")
+            logger.debug("Final request body: %s", request_body)
 
             # Create the GetInfrastructureQuery object
             try:
@@ -307,10 +307,10 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_entities: {result_dict}")
+            logger.debug("Result from get_entities: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_entities: {e}", exc_info=True)
+            logger.error("Error in get_entities: %s", e, exc_info=True)
             return {"error": f"Failed to get entities: {e!s}"}
 
     @register_as_tool(
@@ -363,7 +363,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
             Dictionary containing grouped entities and their aggregated metrics or error information
         """
         try:
-            logger.debug(f"get_aggregated_entity_groups called with payload={payload}")
+            logger.debug("get_aggregated_entity_groups called with payload=%s", payload)
 
             # If no payload is provided, return an error
             if not payload:
@@ -379,7 +379,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.warning(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.warning("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -395,17 +395,17 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.error(f"Failed to parse payload string: {e2}")
+                                logger.error("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.error(f"Error parsing payload string: {e}")
+                    logger.error("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
                 logger.debug("Using provided payload dictionary")
                 request_body = payload
 
-            logger.debug(f"Final request body: {request_body}")
+            logger.debug("Final request body: %s", request_body)
 
             # Create the GetInfrastructureGroupsQuery object
             try:
@@ -453,7 +453,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 return {"error": error_msg}
 
         except Exception as e:
-            logger.error(f"Error in get_aggregated_entity_groups: {e}", exc_info=True)
+            logger.error("Error in get_aggregated_entity_groups: %s", e, exc_info=True)
             return {"error": f"Failed to get aggregated entity groups: {e!s}"}
 
     def _summarize_entity_groups_result(self, result_dict, query_body):
@@ -511,7 +511,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
 
             return summary
         except Exception as e:
-            logger.error(f"Error in _summarize_entity_groups_result: {e}", exc_info=True)
+            logger.error("Error in _summarize_entity_groups_result: %s", e, exc_info=True)
             # If summarization fails, return an error message
             return {
                 "error": f"Failed to summarize results: {e!s}"
@@ -554,7 +554,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
             Dictionary containing available plugins or error information
         """
         try:
-            logger.debug(f"get_available_plugins called with payload={payload}")
+            logger.debug("get_available_plugins called with payload=%s", payload)
 
             # If payload is a string, try to parse it as JSON
             if isinstance(payload, str):
@@ -566,7 +566,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.warning(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.warning("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -582,17 +582,17 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.error(f"Failed to parse payload string: {e2}")
+                                logger.error("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.error(f"Error parsing payload string: {e}")
+                    logger.error("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
                 logger.debug("Using provided payload dictionary")
                 request_body = payload
 
-            logger.debug(f"Final request body: {request_body}")
+            logger.debug("Final request body: %s", request_body)
 
             # Import the GetAvailablePluginsQuery class
             try:
@@ -601,7 +601,7 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GetAvailablePluginsQuery")
             except ImportError as e:
-                logger.error(f"Error importing GetAvailablePluginsQuery: {e}")
+                logger.error("Error importing GetAvailablePluginsQuery: %s", e)
                 return {"error": f"Failed to import GetAvailablePluginsQuery: {e!s}"}
 
             # Create a GetAvailablePluginsQuery object from the request body
@@ -628,11 +628,11 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 if request_body and "tagFilterExpression" in request_body:
                     query_params["tagFilterExpression"] = request_body["tagFilterExpression"]
 
-                logger.debug(f"Creating GetAvailablePluginsQuery with params: {query_params}")
+                logger.debug("Creating GetAvailablePluginsQuery with params: %s", query_params)
                 query_object = GetAvailablePluginsQuery(**query_params)
-                logger.debug(f"Successfully created query object: {query_object}")
+                logger.debug("Successfully created query object: %s", query_object)
             except Exception as e:
-                logger.error(f"Error creating GetAvailablePluginsQuery: {e}")
+                logger.error("Error creating GetAvailablePluginsQuery: %s", e)
                 return {"error": f"Failed to create query object: {e!s}"}
 
             # Call the get_available_plugins method from the SDK with the query object
@@ -646,8 +646,8 @@ class InfrastructureAnalyzeMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_available_plugins: {result_dict}")
+            logger.debug("Result from get_available_plugins: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_available_plugins: {e}", exc_info=True)
+            logger.error("Error in get_available_plugins: %s", e, exc_info=True)
             return {"error": f"Failed to get available plugins: {e!s}"}
@@ -17,7 +17,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp.types import ToolAnnotations
@@ -62,7 +62,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
             Dictionary containing payload keys or error information
         """
         try:
-            logger.debug(f"get_available_payload_keys_by_plugin_id called with plugin_id={plugin_id}")
+            logger.debug("get_available_payload_keys_by_plugin_id called with plugin_id=%s", plugin_id)
 
             if not plugin_id:
                 return {"error": "plugin_id parameter is required"}
@@ -85,17 +85,17 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     result_dict = {"payload_keys": items, "plugin_id": plugin_id}
                 elif isinstance(result, str):
                     # Handle string response (special case for some plugins like db2Database)
-                    logger.debug(f"Received string response for plugin_id={plugin_id}: {result}")
+                    logger.debug("Received string response for plugin_id=%s: %s", plugin_id, result)
                     result_dict = {"message": result, "plugin_id": plugin_id}
                 else:
                     # For any other type, convert to string representation
                     result_dict = {"data": str(result), "plugin_id": plugin_id}
 
-                logger.debug(f"Result from get_available_payload_keys_by_plugin_id: {result_dict}")
+                logger.debug("Result from get_available_payload_keys_by_plugin_id: %s", result_dict)
                 return result_dict
 
             except Exception as sdk_error:
-                logger.error(f"SDK method failed: {sdk_error}, trying fallback")
+                logger.error("SDK method failed: %s, trying fallback", sdk_error)
 
                 # Use the without_preload_content version to get the raw response
                 try:
@@ -116,19 +116,19 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     import json
                     try:
                         result_dict = json.loads(response_text)
-                        logger.debug(f"Result from fallback method (JSON): {result_dict}")
+                        logger.debug("Result from fallback method (JSON): %s", result_dict)
                         return result_dict
                     except json.JSONDecodeError:
                         # If not valid JSON, return as string
-                        logger.debug(f"Result from fallback method (string): {response_text}")
+                        logger.debug("Result from fallback method (string): %s", response_text)
                         return {"message": response_text, "plugin_id": plugin_id}
 
                 except Exception as fallback_error:
-                    logger.warning(f"Fallback method failed: {fallback_error}")
+                    logger.warning("Fallback method failed: %s", fallback_error)
                     raise
 
         except Exception as e:
-            logger.error(f"Error in get_available_payload_keys_by_plugin_id: {e}", exc_info=True)
+            logger.error("Error in get_available_payload_keys_by_plugin_id: %s", e, exc_info=True)
             return {"error": f"Failed to get payload keys: {e!s}", "plugin_id": plugin_id}
 
 
@@ -159,7 +159,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
             List of metric names (strings) - limited to first 50 metrics
         """
         try:
-            logger.debug(f"get_infrastructure_catalog_metrics called with plugin={plugin}, filter={filter}")
+            logger.debug("get_infrastructure_catalog_metrics called with plugin=%s, filter=%s", plugin, filter)
 
             if not plugin:
                 return ["Error: plugin parameter is required"]
@@ -186,7 +186,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                         # Convert to string
                         metric_names.append(str(item))
 
-                logger.debug(f"Received {len(result)} metrics for plugin {plugin}, returning first {len(metric_names)}")
+                logger.debug("Received %s metrics for plugin %s, returning first %s", len(result), plugin, len(metric_names))
                 return metric_names
 
             elif hasattr(result, 'to_dict'):
@@ -205,7 +205,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                         else:
                             metric_names.append(str(item))
 
-                    logger.debug(f"Received {len(result_dict)} metrics for plugin {plugin}, returning first {len(metric_names)}")
+                    logger.debug("Received %s metrics for plugin %s, returning first %s", len(result_dict), plugin, len(metric_names))
                     return metric_names
                 elif isinstance(result_dict, dict):
                     # Try to extract metric names from dict structure
@@ -230,11 +230,11 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     return [f"Unable to parse metrics for plugin {plugin}"]
             else:
                 # For any other format
-                logger.debug(f"Unexpected result type for plugin {plugin}: {type(result)}")
+                logger.debug("Unexpected result type for plugin %s: %s", plugin, type(result))
                 return [f"Unexpected response format for plugin {plugin}"]
 
         except Exception as e:
-            logger.error(f"Error in get_infrastructure_catalog_metrics: {e}", exc_info=True)
+            logger.error("Error in get_infrastructure_catalog_metrics: %s", e, exc_info=True)
             return [f"Error: Failed to get metric catalog for plugin '{plugin}': {e!s}"]
 
 
@@ -275,7 +275,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     elif hasattr(item, 'plugin'):
                         plugin_ids.append(item.plugin)
 
-                logger.debug(f"Extracted {len(plugin_ids)} plugin IDs from response (limited to top 50)")
+                logger.debug("Extracted %s plugin IDs from response (limited to top 50)", len(plugin_ids))
 
                 # Return structured response that encourages listing
                 return {
@@ -306,7 +306,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                 return {"error": "Unable to parse response"}
 
         except Exception as e:
-            logger.error(f"Error in get_infrastructure_catalog_plugins: {e}", exc_info=True)
+            logger.error("Error in get_infrastructure_catalog_plugins: %s", e, exc_info=True)
             return {"error": f"Failed to get plugin catalog: {e!s}"}
 
 
@@ -347,10 +347,10 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                 # Ensure we always return a dictionary
                 result_dict = result if isinstance(result, dict) else {"data": result}
 
-            logger.debug(f"Result from get_infrastructure_catalog_plugins_with_custom_metrics: {result_dict}")
+            logger.debug("Result from get_infrastructure_catalog_plugins_with_custom_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_infrastructure_catalog_plugins_with_custom_metrics: {e}", exc_info=True)
+            logger.error("Error in get_infrastructure_catalog_plugins_with_custom_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get plugins with custom metrics: {e!s}"}
 
 
@@ -371,7 +371,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
             Dictionary containing available tags for the plugin or error information
         """
         try:
-            logger.debug(f"get_tag_catalog called with plugin={plugin}")
+            logger.debug("get_tag_catalog called with plugin=%s", plugin)
 
             if not plugin:
                 return {"error": "plugin parameter is required"}
@@ -390,11 +390,11 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     # If it's already a dict or another format, use it as is
                     result_dict = result
 
-                logger.debug(f"Result from get_tag_catalog: {result_dict}")
+                logger.debug("Result from get_tag_catalog: %s", result_dict)
                 return result_dict
 
             except Exception as sdk_error:
-                logger.error(f"SDK method failed: {sdk_error}, trying with custom headers")
+                logger.error("SDK method failed: %s, trying with custom headers", sdk_error)
 
                 # Check if it's a 406 error
                 is_406_error = False
@@ -427,7 +427,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     import json
                     try:
                         result_dict = json.loads(response_text)
-                        logger.debug(f"Result from SDK with custom headers: {result_dict}")
+                        logger.debug("Result from SDK with custom headers: %s", result_dict)
                         return result_dict
                     except json.JSONDecodeError as json_err:
                         error_message = f"Failed to parse JSON response: {json_err}"
@@ -438,7 +438,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     raise
 
         except Exception as e:
-            logger.error(f"Error in get_tag_catalog: {e}", exc_info=True)
+            logger.error("Error in get_tag_catalog: %s", e, exc_info=True)
             return {"error": f"Failed to get tag catalog: {e!s}"}
 
 
@@ -477,14 +477,14 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                     # If it's already a dict or another format, use it as is
                     full_result = result
 
-                logger.debug(f"Full result from get_tag_catalog_all (standard method): {full_result}")
+                logger.debug("Full result from get_tag_catalog_all (standard method): %s", full_result)
 
                 # Create a summarized version of the response
                 summarized_result = self._summarize_tag_catalog(full_result)
                 return summarized_result
 
             except Exception as sdk_error:
-                logger.error(f"Standard SDK method failed: {sdk_error}, trying fallback")
+                logger.error("Standard SDK method failed: %s, trying fallback", sdk_error)
 
                 # Fallback to using the without_preload_content method
                 response_data = api_client.get_tag_catalog_all_without_preload_content()
@@ -506,7 +506,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
                 import json
                 try:
                     full_result = json.loads(response_text)
-                    logger.debug(f"Full result from get_tag_catalog_all (fallback method): {full_result}")
+                    logger.debug("Full result from get_tag_catalog_all (fallback method): %s", full_result)
 
                     # Create a summarized version of the response
                     summarized_result = self._summarize_tag_catalog(full_result)
@@ -514,11 +514,11 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
 
                 except json.JSONDecodeError as json_err:
                     error_message = f"Failed to parse JSON response: {json_err}"
-                    logger.error(f"Response text: {response_text}")
+                    logger.error("Response text: %s", response_text)
                     return {"error": error_message}
 
         except Exception as e:
-            logger.error(f"Error in get_tag_catalog_all: {e}", exc_info=True)
+            logger.error("Error in get_tag_catalog_all: %s", e, exc_info=True)
             return {"error": f"Failed to get tag catalog: {e!s}"}
 
     def _summarize_tag_catalog(self, full_catalog: Dict[str, Any]) -> Dict[str, Any]:
@@ -589,7 +589,7 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
 
             # Call the get_infrastructure_catalog_search_fields method from the SDK
             result = api_client.get_infrastructure_catalog_search_fields()
-            logger.debug(f"API call successful, got {len(result)} search fields")
+            logger.debug("API call successful, got %s search fields", len(result))
 
             # Extract just 10 keywords to keep it very small
             keywords = []
@@ -612,5 +612,5 @@ class InfrastructureCatalogMCPTools(BaseInstanaClient):
             return {"search_fields": keywords, "count": len(keywords)}
 
         except Exception as e:
-            logger.error(f"Error: {e}")
+            logger.error("Error: %s", e)
             return {"error": str(e)}
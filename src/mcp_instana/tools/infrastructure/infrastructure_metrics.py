@@ -4,9 +4,8 @@ Infrastructure Metrics MCP Tools Module
 This module provides infrastructure metrics-specific MCP tools for Instana monitoring.
 """
 
-import json
 import logging
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
@@ -15,6 +14,7 @@ from pydantic import StrictBool
 from mcp_instana.utils import (
     BaseInstanaClient,
     register_as_tool,
+    safe_dump,
     with_header_auth,
 )
 
@@ -28,7 +28,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 # Configure logger for this module
@@ -92,7 +92,7 @@ class InfrastructureMetricsMCPTools(BaseInstanaClient):
 
 
             if not time_frame:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
                 from_time = to_time - (60 * 60 * 1000)  # Default to 1 hour
                 time_frame = {
                     "from": from_time,
@@ -116,12 +116,13 @@ class InfrastructureMetricsMCPTools(BaseInstanaClient):
                 if isinstance(snapshot_ids, str):
                     snapshot_ids = [snapshot_ids]
                 elif not isinstance(snapshot_ids, list):
-                    logger.debug(f"Invalid snapshot_ids type: {type(snapshot_ids)}")
+                    logger.debug("Invalid snapshot_ids type: %s", type(snapshot_ids))
                     return {"error": "snapshot_ids must be a string or list of strings"}
                 request_body["snapshotIds"] = snapshot_ids
 
             logger.debug("Sending request to Instana SDK with payload:")
-            logger.debug(json.dumps(request_body, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(safe_dump(request_body))
 
             # Create the InfrastructureMetricsApi object
             get_combined_metrics = GetCombinedMetrics(**request_body)
@@ -153,7 +154,7 @@ class InfrastructureMetricsMCPTools(BaseInstanaClient):
                 original_count = len(items_list)
                 if original_count > 3:
                     result_dict["items"] = items_list[:3]
-                    logger.debug(f"Limited response items from {original_count} to 3")
+                    logger.debug("Limited response items from %s to 3", original_count)
 
             # Remove any large nested structures to further reduce size
             if isinstance(result_dict, dict):
@@ -161,15 +162,13 @@ class InfrastructureMetricsMCPTools(BaseInstanaClient):
                     if isinstance(value, list) and len(value) > 3 and key != "items":
                         original_count = len(value)
                         result_dict[key] = value[:3]
-                        logger.debug(f"Limited {key} from {original_count} to 3")
+                        logger.debug("Limited %s from %s to 3", key, original_count)
 
-            try:
-                logger.debug(f"Result from get_infrastructure_metrics: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from get_infrastructure_metrics: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from get_infrastructure_metrics: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_infrastructure_metrics: {e}", exc_info=True)
+            logger.error("Error in get_infrastructure_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get Infra metrics: {e!s}"}
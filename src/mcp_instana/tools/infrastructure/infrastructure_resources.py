@@ -6,7 +6,7 @@ This module provides infrastructure resources-specific MCP tools for Instana mon
 
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Any, Dict, List, Optional, Union
 
 # Import the necessary classes from the SDK
@@ -66,10 +66,10 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             # Call the get_monitoring_state method from the SDK
             result = api_client.get_monitoring_state()
 
-            logger.debug(f"Result from get_monitoring_state: {result}")
+            logger.debug("Result from get_monitoring_state: %s", result)
             return result
         except Exception as e:
-            logger.error(f"Error in get_monitoring_state: {e}", exc_info=True)
+            logger.error("Error in get_monitoring_state: %s", e, exc_info=True)
             return {"error": f"Failed to get monitoring state: {e!s}"}
 
     @register_as_tool(
@@ -100,7 +100,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             Dictionary containing the payload data or error information
         """
         try:
-            logger.debug(f"get_plugin_payload called with snapshot_id={snapshot_id}, payload_key={payload_key}")
+            logger.debug("get_plugin_payload called with snapshot_id=%s, payload_key=%s", snapshot_id, payload_key)
 
             # Call the get_plugin_payload method from the SDK
             result = api_client.get_plugin_payload(
@@ -110,10 +110,10 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                 window_size=window_size
             )
 
-            logger.debug(f"Result from get_plugin_payload: {result}")
+            logger.debug("Result from get_plugin_payload: %s", result)
             return result
         except Exception as e:
-            logger.error(f"Error in get_plugin_payload: {e}", exc_info=True)
+            logger.error("Error in get_plugin_payload: %s", e, exc_info=True)
             return {"error": f"Failed to get plugin payload: {e!s}"}
 
     @register_as_tool(
@@ -149,7 +149,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             Dictionary containing snapshot details or error information
         """
         try:
-            logger.debug(f"get_snapshot called with snapshot_id={snapshot_id}")
+            logger.debug("get_snapshot called with snapshot_id=%s", snapshot_id)
 
             if not snapshot_id:
                 return {"error": "snapshot_id parameter is required"}
@@ -172,11 +172,11 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                     # For any other type, convert to string representation
                     result_dict = {"data": str(result), "snapshot_id": snapshot_id}
 
-                logger.debug(f"Result from get_snapshot: {result_dict}")
+                logger.debug("Result from get_snapshot: %s", result_dict)
                 return result_dict
 
             except Exception as sdk_error:
-                logger.warning(f"SDK method failed: {sdk_error}, trying fallback")
+                logger.warning("SDK method failed: %s, trying fallback", sdk_error)
 
                 # Check if it's a "not found" error
                 error_str = str(sdk_error).lower()
@@ -209,22 +209,22 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                         import json
                         try:
                             result_dict = json.loads(response_text)
-                            logger.info(f"Result from fallback method: {result_dict}")
+                            logger.info("Result from fallback method: %s", result_dict)
                             return result_dict
                         except json.JSONDecodeError:
                             # If not valid JSON, return as string
-                            logger.error(f"Result from fallback method (string): {response_text}")
+                            logger.error("Result from fallback method (string): %s", response_text)
                             return {"message": response_text, "snapshot_id": snapshot_id}
 
                     except Exception as fallback_error:
-                        logger.error(f"Fallback method failed: {fallback_error}")
+                        logger.error("Fallback method failed: %s", fallback_error)
                         # Continue to the general error handling
 
                 # Re-raise if we couldn't handle it specifically
                 raise
 
         except Exception as e:
-            logger.error(f"Error in get_snapshot: {e}", exc_info=True)
+            logger.error("Error in get_snapshot: %s", e, exc_info=True)
             return {"error": f"Failed to get snapshot: {e!s}"}
 
     @register_as_tool(
@@ -269,11 +269,11 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             Dictionary containing matching snapshots (summarized by default) or error information
         """
         try:
-            logger.debug(f"get_snapshots called with query={query}, from_time={from_time}, to_time={to_time}, size={size}, detailed={detailed}")
+            logger.debug("get_snapshots called with query=%s, from_time=%s, to_time=%s, size=%s, detailed=%s", query, from_time, to_time, size, detailed)
 
             # Set default time range if not provided
             if not to_time:
-                to_time = int(datetime.now().timestamp() * 1000)
+                to_time = time.time_ns() // 1_000_000
 
             if not from_time:
                 from_time = to_time - (60 * 60 * 1000)  # Default to 1 hour
@@ -288,7 +288,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                 offline=offline
             )
 
-            logger.debug(f"SDK returned result type: {type(result)}")
+            logger.debug("SDK returned result type: %s", type(result))
 
             # Convert result to dictionary if needed
             if hasattr(result, 'to_dict'):
@@ -298,7 +298,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             else:
                 result_dict = {"data": str(result)}
 
-            logger.debug(f"Result dict keys: {list(result_dict.keys()) if isinstance(result_dict, dict) else 'Not a dict'}")
+            logger.debug("Result dict keys: %s", list(result_dict.keys()) if isinstance(result_dict, dict) else 'Not a dict')
 
             # Return based on detailed parameter
             if detailed:
@@ -309,7 +309,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                 return self._summarize_get_snapshots_response(result_dict)
 
         except Exception as e:
-            logger.error(f"Error in get_snapshots: {e}", exc_info=True)
+            logger.error("Error in get_snapshots: %s", e, exc_info=True)
             return {"error": f"Failed to get snapshots: {e!s}"}
 
     def _summarize_get_snapshots_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -377,7 +377,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             }
 
         except Exception as e:
-            logger.error(f"Error summarizing get_snapshots response: {e}", exc_info=True)
+            logger.error("Error summarizing get_snapshots response: %s", e, exc_info=True)
             return {
                 "error": "Failed to summarize response",
                 "details": str(e)
@@ -410,7 +410,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             Dictionary containing snapshot details (summarized by default) or error information
         """
         try:
-            logger.debug(f"post_snapshots called with snapshot_ids={snapshot_ids}, detailed={detailed}")
+            logger.debug("post_snapshots called with snapshot_ids=%s, detailed=%s", snapshot_ids, detailed)
 
             # Handle string input conversion
             if isinstance(snapshot_ids, str):
@@ -429,7 +429,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             if not window_size:
                 window_size = 3600000
 
-            logger.debug(f"Using to_time={to_time}, window_size={window_size}")
+            logger.debug("Using to_time=%s, window_size=%s", to_time, window_size)
 
             if has_get_snapshots_query:
                 from instana_client.models.get_snapshots_query import (
@@ -450,7 +450,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                     get_snapshots_query=query_obj
                 )
 
-                logger.debug(f"SDK response status: {response.status}")
+                logger.debug("SDK response status: %s", response.status)
 
                 if response.status == 200:
                     # Parse the JSON response manually
@@ -458,7 +458,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                     response_text = response.data.decode('utf-8')
                     result_dict = json.loads(response_text)
 
-                    logger.debug(f"Successfully parsed response with {len(result_dict.get('items', []))} items")
+                    logger.debug("Successfully parsed response with %s items", len(result_dict.get('items', [])))
 
                     # Return based on detailed parameter
                     if detailed:
@@ -476,7 +476,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                 return {"error": "GetSnapshotsQuery model not available"}
 
         except Exception as e:
-            logger.error(f"Error in post_snapshots: {e}", exc_info=True)
+            logger.error("Error in post_snapshots: %s", e, exc_info=True)
             return {"error": f"Failed to post snapshots: {e!s}"}
 
     def _summarize_snapshots_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -493,7 +493,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             }
 
             for item in items:
-                logger.debug(f"Processing snapshot: {item.get('snapshotId')} - {item.get('plugin')}")
+                logger.debug("Processing snapshot: %s - %s", item.get('snapshotId'), item.get('plugin'))
 
                 snapshot_summary = {
                     "snapshotId": item.get('snapshotId'),
@@ -544,7 +544,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                     }
                 else:
                     # Generic summary for other plugin types
-                    logger.debug(f"Processing generic snapshot for plugin: {item.get('plugin')}")
+                    logger.debug("Processing generic snapshot for plugin: %s", item.get('plugin'))
                     snapshot_summary["key_info"] = {
                         "data_keys": list(data.keys())[:10],  # First 10 keys
                         "total_data_fields": len(data.keys())
@@ -552,11 +552,11 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
 
                 summary["snapshots"].append(snapshot_summary)
 
-            logger.debug(f"Created summary with {len(summary['snapshots'])} snapshots")
+            logger.debug("Created summary with %s snapshots", len(summary['snapshots']))
             return summary
 
         except Exception as e:
-            logger.error(f"Error summarizing response: {e}", exc_info=True)
+            logger.error("Error summarizing response: %s", e, exc_info=True)
             return {
                 "error": "Failed to summarize response",
                 "details": str(e),
@@ -587,7 +587,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             # Call the software_versions method from the SDK with no parameters
             result = api_client.software_versions()
 
-            logger.info(f"API call successful. Result type: {type(result)}")
+            logger.info("API call successful. Result type: %s", type(result))
 
             # Handle different response formats
             if hasattr(result, 'to_dict'):
@@ -600,7 +600,7 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
                 logger.info("Result is a list")
                 result_dict = {"items": result}
             else:
-                logger.info(f"Unexpected result format: {type(result)}")
+                logger.info("Unexpected result format: %s", type(result))
                 # Try to convert to a dictionary or string representation
                 try:
                     result_dict = {"data": str(result)}
@@ -610,12 +610,12 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
             # Print a sample of the result for debugging
             if isinstance(result_dict, dict):
                 keys = list(result_dict.keys())
-                logger.info(f"Result keys: {keys}")
+                logger.info("Result keys: %s", keys)
 
                 # If the result is very large, return a summary
                 if 'items' in result_dict and isinstance(result_dict['items'], list):
                     items_count = len(result_dict['items'])
-                    logger.info(f"Found {items_count} items in the response")
+                    logger.info("Found %s items in the response", items_count)
 
                     # Limit the number of items to return
                     if items_count > 10:
@@ -642,6 +642,6 @@ class InfrastructureResourcesMCPTools(BaseInstanaClient):
 
             return result_dict
         except Exception as e:
-            logger.error(f"Error in software_versions: {e}", exc_info=True)
+            logger.error("Error in software_versions: %s", e, exc_info=True)
             return {"error": f"Failed to get software versions: {e!s}"}
 
@@ -89,7 +89,7 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
             Dictionary containing related hosts information or error information
         """
         try:
-            logger.debug(f"get_related_hosts called with snapshot_id={snapshot_id}")
+            logger.debug("get_related_hosts called with snapshot_id=%s", snapshot_id)
 
             if not snapshot_id:
                 return {"error": "snapshot_id parameter is required"}
@@ -112,11 +112,11 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
                 # For any other type, convert to string representation
                 result_dict = {"data": str(result), "snapshotId": snapshot_id}
 
-            logger.debug(f"Result from get_related_hosts: {result_dict}")
+            logger.debug("Result from get_related_hosts: %s", result_dict)
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_related_hosts: {e}", exc_info=True)
+            logger.error("Error in get_related_hosts: %s", e, exc_info=True)
             return {"error": f"Failed to get related hosts: {e!s}"}
 
     @register_as_tool(
@@ -152,14 +152,14 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
             Dictionary containing infrastructure topology information with detailed summary or error information
         """
         try:
-            logger.debug(f"get_topology called - using include_data={include_data}")
+            logger.debug("get_topology called - using include_data=%s", include_data)
 
             # Use the API client from the decorator
             try:
                 result = api_client.get_topology(include_data=include_data)
                 logger.debug("SDK call successful, processing result")
             except Exception as sdk_error:
-                logger.error(f"SDK validation error: {sdk_error}")
+                logger.error("SDK validation error: %s", sdk_error)
 
                 # If it's a validation error, try to extract useful information from the error
                 if "validation error" in str(sdk_error).lower():
@@ -182,7 +182,7 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
                     result_dict = result.to_dict()
                     logger.debug("Successfully converted result using to_dict()")
                 except Exception as e:
-                    logger.error(f"to_dict() failed: {e}")
+                    logger.error("to_dict() failed: %s", e)
 
             if result_dict is None and isinstance(result, dict):
                 result_dict = result
@@ -198,7 +198,7 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
                         result_dict = {"data": str(result)}
                         logger.debug("Converted result to string representation")
                 except Exception as e:
-                    logger.error(f"Manual extraction failed: {e}")
+                    logger.error("Manual extraction failed: %s", e)
                     result_dict = {"data": str(result)}
 
             # Process the result if we have valid data
@@ -206,7 +206,7 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
                 nodes = result_dict.get('nodes', [])
                 edges = result_dict.get('edges', [])
 
-                logger.debug(f"Processing {len(nodes)} nodes and {len(edges)} edges")
+                logger.debug("Processing %s nodes and %s edges", len(nodes), len(edges))
 
                 # If we have no nodes but have data, try to extract from data field
                 if not nodes and 'data' in result_dict:
@@ -323,7 +323,7 @@ class InfrastructureTopologyMCPTools(BaseInstanaClient):
                 }
 
         except Exception as e:
-            logger.error(f"Error in get_topology: {e}", exc_info=True)
+            logger.error("Error in get_topology: %s", e, exc_info=True)
             return {
                 "error": f"Failed to get topology: {e!s}",
                 "errorType": type(e).__name__,
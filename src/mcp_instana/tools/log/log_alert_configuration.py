@@ -39,7 +39,7 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
         super().__init__(read_token=read_token, base_url=base_url)
 
         try:
-            logger.debug(f"Initializing LogAlertConfigurationMCPTools with base_url={base_url}")
+            logger.debug("Initializing LogAlertConfigurationMCPTools with base_url=%s", base_url)
 
             # Configure the API client with the correct base URL and authentication
             configuration = Configuration()
@@ -52,9 +52,9 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
 
             # Initialize the Instana SDK's LogAlertConfigurationApi with our configured client
             self.log_alert_api = LogAlertConfigurationApi(api_client=api_client)
-            logger.debug(f"Initialized LogAlertConfigurationApi with host: {configuration.host}")
+            logger.debug("Initialized LogAlertConfigurationApi with host: %s", configuration.host)
         except Exception as e:
-            logger.error(f"Error initializing LogAlertConfigurationApi: {e}", exc_info=True)
+            logger.error("Error initializing LogAlertConfigurationApi: %s", e, exc_info=True)
             raise
 
     @register_as_tool(
@@ -80,26 +80,26 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the created log alert configuration or error information
         """
         try:
-            logger.debug(f"create_log_alert_config called with config={config}")
+            logger.debug("create_log_alert_config called with config=%s", config)
 
             try:
                 # Convert dictionary to LogAlertConfig model
                 log_alert_config = LogAlertConfig(**config)
             except Exception as e:
-                logger.error(f"Error creating LogAlertConfig: {e}", exc_info=True)
+                logger.error("Error creating LogAlertConfig: %s", e, exc_info=True)
                 return {"error": f"Failed to create log alert configuration: {e!s}"}
 
             try:
                 # Call the API
                 result = api_client.create_log_alert_config(log_alert_config=log_alert_config)
-                logger.debug(f"Result from create_log_alert_config: {result}")
+                logger.debug("Result from create_log_alert_config: %s", result)
 
                 return self._convert_to_dict(result)
             except Exception as e:
-                logger.error(f"Error calling create_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling create_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to create log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in create_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in create_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to create log alert configuration: {e!s}"}
 
     @register_as_tool(
@@ -119,17 +119,17 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the result of the deletion operation or error information
         """
         try:
-            logger.debug(f"delete_log_alert_config called with id={id}")
+            logger.debug("delete_log_alert_config called with id=%s", id)
 
             try:
                 api_client.delete_log_alert_config(id=id)
-                logger.debug(f"Successfully deleted log alert configuration with ID {id}")
+                logger.debug("Successfully deleted log alert configuration with ID %s", id)
                 return {"success": True, "message": f"Log alert configuration with ID {id} deleted successfully"}
             except Exception as e:
-                logger.error(f"Error calling delete_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling delete_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to delete log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in delete_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in delete_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to delete log alert configuration: {e!s}"}
 
     @register_as_tool(
@@ -149,17 +149,17 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the result of the disable operation or error information
         """
         try:
-            logger.debug(f"disable_log_alert_config called with id={id}")
+            logger.debug("disable_log_alert_config called with id=%s", id)
 
             try:
                 api_client.disable_log_alert_config(id=id)
-                logger.debug(f"Successfully disabled log alert configuration with ID {id}")
+                logger.debug("Successfully disabled log alert configuration with ID %s", id)
                 return {"success": True, "message": f"Log alert configuration with ID {id} disabled successfully"}
             except Exception as e:
-                logger.error(f"Error calling disable_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling disable_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to disable log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in disable_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in disable_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to disable log alert configuration: {e!s}"}
 
     @register_as_tool(
@@ -179,17 +179,17 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the result of the enable operation or error information
         """
         try:
-            logger.debug(f"enable_log_alert_config called with id={id}")
+            logger.debug("enable_log_alert_config called with id=%s", id)
 
             try:
                 api_client.enable_log_alert_config(id=id)
-                logger.debug(f"Successfully enabled log alert configuration with ID {id}")
+                logger.debug("Successfully enabled log alert configuration with ID %s", id)
                 return {"success": True, "message": f"Log alert configuration with ID {id} enabled successfully"}
             except Exception as e:
-                logger.error(f"Error calling enable_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling enable_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to enable log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in enable_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in enable_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to enable log alert configuration: {e!s}"}
 
     @register_as_tool(
@@ -209,12 +209,12 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing active log alert configurations or error information
         """
         try:
-            logger.debug(f"find_active_log_alert_configs called with alert_ids={alert_ids}")
+            logger.debug("find_active_log_alert_configs called with alert_ids=%s", alert_ids)
 
             try:
                 # Call the API with raw JSON response to avoid Pydantic validation issues
                 result = api_client.find_active_log_alert_configs_without_preload_content(alert_ids=alert_ids)
-                logger.debug(f"Result from find_active_log_alert_configs: {result}")
+                logger.debug("Result from find_active_log_alert_configs: %s", result)
 
                 # Parse the JSON response manually
                 import json
@@ -228,10 +228,10 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
                     logger.error(error_message)
                     return {"error": error_message}
             except Exception as e:
-                logger.error(f"Error calling find_active_log_alert_configs API: {e}", exc_info=True)
+                logger.error("Error calling find_active_log_alert_configs API: %s", e, exc_info=True)
                 return {"error": f"Failed to find active log alert configurations: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in find_active_log_alert_configs: {e}", exc_info=True)
+            logger.error("Error in find_active_log_alert_configs: %s", e, exc_info=True)
             return {"error": f"Failed to find active log alert configurations: {e!s}"}
 
     @register_as_tool(
@@ -252,12 +252,12 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the log alert configuration or error information
         """
         try:
-            logger.debug(f"find_log_alert_config called with id={id}, valid_on={valid_on}")
+            logger.debug("find_log_alert_config called with id=%s, valid_on=%s", id, valid_on)
 
             try:
                 # Call the API with raw JSON response to avoid Pydantic validation issues
                 result = api_client.find_log_alert_config_without_preload_content(id=id, valid_on=valid_on)
-                logger.debug(f"Result from find_log_alert_config: {result}")
+                logger.debug("Result from find_log_alert_config: %s", result)
 
                 # Parse the JSON response manually
                 import json
@@ -271,10 +271,10 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
                     logger.error(error_message)
                     return {"error": error_message}
             except Exception as e:
-                logger.error(f"Error calling find_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling find_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to find log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in find_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in find_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to find log alert configuration: {e!s}"}
 
     @register_as_tool(
@@ -294,12 +294,12 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing versions of the log alert configuration or error information
         """
         try:
-            logger.debug(f"find_log_alert_config_versions called with id={id}")
+            logger.debug("find_log_alert_config_versions called with id=%s", id)
 
             try:
                 # Call the API with raw JSON response to avoid Pydantic validation issues
                 result = api_client.find_log_alert_config_versions_without_preload_content(id=id)
-                logger.debug(f"Result from find_log_alert_config_versions: {result}")
+                logger.debug("Result from find_log_alert_config_versions: %s", result)
 
                 # Parse the JSON response manually
                 import json
@@ -313,10 +313,10 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
                     logger.error(error_message)
                     return {"error": error_message}
             except Exception as e:
-                logger.error(f"Error calling find_log_alert_config_versions API: {e}", exc_info=True)
+                logger.error("Error calling find_log_alert_config_versions API: %s", e, exc_info=True)
                 return {"error": f"Failed to find log alert configuration versions: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in find_log_alert_config_versions: {e}", exc_info=True)
+            logger.error("Error in find_log_alert_config_versions: %s", e, exc_info=True)
             return {"error": f"Failed to find log alert configuration versions: {e!s}"}
 
     @register_as_tool(
@@ -337,20 +337,20 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the result of the restore operation or error information
         """
         try:
-            logger.debug(f"restore_log_alert_config called with id={id}, created={created}")
+            logger.debug("restore_log_alert_config called with id=%s, created=%s", id, created)
 
             try:
                 api_client.restore_log_alert_config(id=id, created=created)
-                logger.debug(f"Successfully restored log alert configuration with ID {id}")
+                logger.debug("Successfully restored log alert configuration with ID %s", id)
                 return {
                     "success": True,
                     "message": f"Log alert configuration with ID {id} restored to version from {datetime.fromtimestamp(created/1000).isoformat()}"
                 }
             except Exception as e:
-                logger.error(f"Error calling restore_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling restore_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to restore log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in restore_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in restore_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to restore log alert configuration: {e!s}"}
 
     @register_as_tool(
@@ -371,25 +371,25 @@ class LogAlertConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing the updated log alert configuration or error information
         """
         try:
-            logger.debug(f"update_log_alert_config called with id={id}, config={config}")
+            logger.debug("update_log_alert_config called with id=%s, config=%s", id, config)
 
             try:
                 # Convert dictionary to LogAlertConfig model
                 log_alert_config = LogAlertConfig(**config)
             except Exception as e:
-                logger.error(f"Error creating LogAlertConfig: {e}", exc_info=True)
+                logger.error("Error creating LogAlertConfig: %s", e, exc_info=True)
                 return {"error": f"Failed to update log alert configuration: {e!s}"}
 
             try:
                 # Call the API
                 result = api_client.update_log_alert_config(id=id, log_alert_config=log_alert_config)
-                logger.debug(f"Result from update_log_alert_config: {result}")
+                logger.debug("Result from update_log_alert_config: %s", result)
                 return self._convert_to_dict(result)
             except Exception as e:
-                logger.error(f"Error calling update_log_alert_config API: {e}", exc_info=True)
+                logger.error("Error calling update_log_alert_config API: %s", e, exc_info=True)
                 return {"error": f"Failed to update log alert configuration: {e!s}"}
         except Exception as e:
-            logger.error(f"Error in update_log_alert_config: {e}", exc_info=True)
+            logger.error("Error in update_log_alert_config: %s", e, exc_info=True)
             return {"error": f"Failed to update log alert configuration: {e!s}"}
 
     def _convert_to_dict(self, obj: Any) -> Dict[str, Any]:
@@ -4,7 +4,6 @@ Custom Dashboard MCP Tools Module
 This module provides custom dashboard-specific MCP tools for Instana monitoring.
 """
 
-import json
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -13,6 +12,7 @@ from mcp.types import ToolAnnotations
 from mcp_instana.utils import (
     BaseInstanaClient,
     register_as_tool,
+    safe_dump,
     with_header_auth,
 )
 
@@ -23,7 +23,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 # Configure logger for this module
@@ -81,17 +81,15 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 original_count = len(items_list)
                 if original_count > 10:
                     result_dict["items"] = items_list[:10]
-                    logger.debug(f"Limited response items from {original_count} to 10")
+                    logger.debug("Limited response items from %s to 10", original_count)
 
-            try:
-                logger.debug(f"Result from get_custom_dashboards: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from get_custom_dashboards: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from get_custom_dashboards: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_custom_dashboards: {e}", exc_info=True)
+            logger.error("Error in get_custom_dashboards: %s", e, exc_info=True)
             return {"error": f"Failed to get custom dashboards: {e!s}"}
 
     @register_as_tool(
@@ -118,7 +116,7 @@ class CustomDashboardMCPTools(BaseInstanaClient):
             if not dashboard_id:
                 return {"error": "Dashboard ID is required for this operation"}
 
-            logger.debug(f"Getting custom dashboard {dashboard_id} from Instana SDK")
+            logger.debug("Getting custom dashboard %s from Instana SDK", dashboard_id)
 
             # Call the get_custom_dashboard method from the SDK
             result = api_client.get_custom_dashboard(dashboard_id=dashboard_id)
@@ -134,15 +132,13 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 # For any other type, convert to string and wrap
                 result_dict = {"result": str(result)}
 
-            try:
-                logger.debug(f"Result from get_custom_dashboard: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from get_custom_dashboard: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from get_custom_dashboard: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_custom_dashboard: {e}", exc_info=True)
+            logger.error("Error in get_custom_dashboard: %s", e, exc_info=True)
             return {"error": f"Failed to get custom dashboard: {e!s}"}
 
     @register_as_tool(
@@ -173,7 +169,8 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 return {"error": "Custom dashboard configuration is required for this operation"}
 
             logger.debug("Adding custom dashboard to Instana SDK")
-            logger.debug(json.dumps(custom_dashboard, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(safe_dump(custom_dashboard))
 
             # Create the CustomDashboard object
             dashboard_obj = CustomDashboard(**custom_dashboard)
@@ -192,15 +189,13 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 # For any other type, convert to string and wrap
                 result_dict = {"result": str(result)}
 
-            try:
-                logger.debug(f"Result from add_custom_dashboard: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from add_custom_dashboard: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from add_custom_dashboard: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in add_custom_dashboard: {e}", exc_info=True)
+            logger.error("Error in add_custom_dashboard: %s", e, exc_info=True)
             return {"error": f"Failed to add custom dashboard: {e!s}"}
 
     @register_as_tool(
@@ -231,8 +226,9 @@ class CustomDashboardMCPTools(BaseInstanaClient):
             if not custom_dashboard:
                 return {"error": "Custom dashboard configuration is required for this operation"}
 
-            logger.debug(f"Updating custom dashboard {dashboard_id} in Instana SDK")
-            logger.debug(json.dumps(custom_dashboard, indent=2))
+            logger.debug("Updating custom dashboard %s in Instana SDK", dashboard_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(safe_dump(custom_dashboard))
 
             # Create the CustomDashboard object
             dashboard_obj = CustomDashboard(**custom_dashboard)
@@ -254,15 +250,13 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 # For any other type, convert to string and wrap
                 result_dict = {"result": str(result)}
 
-            try:
-                logger.debug(f"Result from update_custom_dashboard: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from update_custom_dashboard: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from update_custom_dashboard: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in update_custom_dashboard: {e}", exc_info=True)
+            logger.error("Error in update_custom_dashboard: %s", e, exc_info=True)
             return {"error": f"Failed to update custom dashboard: {e!s}"}
 
     @register_as_tool(
@@ -288,7 +282,7 @@ class CustomDashboardMCPTools(BaseInstanaClient):
             if not dashboard_id:
                 return {"error": "Dashboard ID is required for this operation"}
 
-            logger.debug(f"Deleting custom dashboard {dashboard_id} from Instana SDK")
+            logger.debug("Deleting custom dashboard %s from Instana SDK", dashboard_id)
 
             # Call the delete_custom_dashboard method from the SDK
             result = api_client.delete_custom_dashboard(dashboard_id=dashboard_id)
@@ -304,15 +298,13 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 # For any other type, convert to string and wrap
                 result_dict = {"result": str(result)}
 
-            try:
-                logger.debug(f"Result from delete_custom_dashboard: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from delete_custom_dashboard: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from delete_custom_dashboard: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in delete_custom_dashboard: {e}", exc_info=True)
+            logger.error("Error in delete_custom_dashboard: %s", e, exc_info=True)
             return {"error": f"Failed to delete custom dashboard: {e!s}"}
 
     @register_as_tool(
@@ -338,7 +330,7 @@ class CustomDashboardMCPTools(BaseInstanaClient):
             if not dashboard_id:
                 return {"error": "Dashboard ID is required for this operation"}
 
-            logger.debug(f"Getting shareable users for dashboard {dashboard_id} from Instana SDK")
+            logger.debug("Getting shareable users for dashboard %s from Instana SDK", dashboard_id)
 
             # Call the get_shareable_users method from the SDK
             result = api_client.get_shareable_users(dashboard_id=dashboard_id)
@@ -364,17 +356,15 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 original_count = len(items_list)
                 if original_count > 20:
                     result_dict["items"] = items_list[:20]
-                    logger.debug(f"Limited response items from {original_count} to 20")
+                    logger.debug("Limited response items from %s to 20", original_count)
 
-            try:
-                logger.debug(f"Result from get_shareable_users: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from get_shareable_users: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from get_shareable_users: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_shareable_users: {e}", exc_info=True)
+            logger.error("Error in get_shareable_users: %s", e, exc_info=True)
             return {"error": f"Failed to get shareable users: {e!s}"}
 
     @register_as_tool(
@@ -400,7 +390,7 @@ class CustomDashboardMCPTools(BaseInstanaClient):
             if not dashboard_id:
                 return {"error": "Dashboard ID is required for this operation"}
 
-            logger.debug(f"Getting shareable API tokens for dashboard {dashboard_id} from Instana SDK")
+            logger.debug("Getting shareable API tokens for dashboard %s from Instana SDK", dashboard_id)
 
             # Call the get_shareable_api_tokens method from the SDK
             result = api_client.get_shareable_api_tokens(dashboard_id=dashboard_id)
@@ -426,15 +416,13 @@ class CustomDashboardMCPTools(BaseInstanaClient):
                 original_count = len(items_list)
                 if original_count > 10:
                     result_dict["items"] = items_list[:10]
-                    logger.debug(f"Limited response items from {original_count} to 10")
+                    logger.debug("Limited response items from %s to 10", original_count)
 
-            try:
-                logger.debug(f"Result from get_shareable_api_tokens: {json.dumps(result_dict, indent=2)}")
-            except TypeError:
-                logger.debug(f"Result from get_shareable_api_tokens: {result_dict} (not JSON serializable)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result from get_shareable_api_tokens: %s", safe_dump(result_dict))
 
             return result_dict
 
         except Exception as e:
-            logger.error(f"Error in get_shareable_api_tokens: {e}", exc_info=True)
+            logger.error("Error in get_shareable_api_tokens: %s", e, exc_info=True)
             return {"error": f"Failed to get shareable API tokens: {e!s}"}
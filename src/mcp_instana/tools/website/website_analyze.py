@@ -31,7 +31,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp.types import ToolAnnotations
@@ -126,7 +126,7 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -142,10 +142,10 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -157,8 +157,8 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                 logger.debug("Found nested payload structure, extracting inner payload")
                 request_body = request_body["payload"]
 
-            logger.debug(f"Final request_body structure: {request_body}")
-            logger.debug(f"Request body keys: {list(request_body.keys()) if isinstance(request_body, dict) else 'Not a dict'}")
+            logger.debug("Final request_body structure: %s", request_body)
+            logger.debug("Request body keys: %s", list(request_body.keys()) if isinstance(request_body, dict) else 'Not a dict')
 
             try:
                 from instana_client.models.get_website_beacon_groups import (
@@ -166,7 +166,7 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GetWebsiteBeaconGroups")
             except ImportError as e:
-                logger.debug(f"Error importing GetWebsiteBeaconGroups: {e}")
+                logger.debug("Error importing GetWebsiteBeaconGroups: %s", e)
                 return {"error": f"Failed to import GetWebsiteBeaconGroups: {e!s}"}
 
             # Create an GetWebsiteBeaconGroups object from the request body
@@ -221,11 +221,11 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                 if request_body and "pagination" in request_body:
                     query_params["pagination"] = request_body["pagination"]
 
-                logger.debug(f"Creating GetWebsiteBeaconGroups with params: {query_params}")
+                logger.debug("Creating GetWebsiteBeaconGroups with params: %s", query_params)
                 config_object = GetWebsiteBeaconGroups(**query_params)
                 logger.debug("Successfully created GetWebsiteBeaconGroups object")
             except Exception as e:
-                logger.debug(f"Error creating GetWebsiteBeaconGroups: {e}")
+                logger.debug("Error creating GetWebsiteBeaconGroups: %s", e)
                 return {"error": f"Failed to get website beacon groups: {e!s}"}
 
             # Call the get_beacon_groups method from the SDK using without_preload_content to avoid NaN validation errors
@@ -252,13 +252,13 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
 
                 logger.debug("Successfully parsed raw response")
 
-                logger.debug(f"Result from get_website_beacon_groups: {result_dict}")
+                logger.debug("Result from get_website_beacon_groups: %s", result_dict)
                 return result_dict
             except Exception as api_error:
                 # Handle validation errors from the SDK, particularly for customMetric 'NaN' values
                 error_msg = str(api_error)
                 if "customMetric" in error_msg and "NaN" in error_msg:
-                    logger.warning(f"API returned 'NaN' values for customMetric field: {error_msg}")
+                    logger.warning("API returned 'NaN' values for customMetric field: %s", error_msg)
                     return {
                         "error": "API returned invalid data (NaN values for customMetric field). This is a known issue with the Instana API response format.",
                         "details": error_msg,
@@ -268,7 +268,7 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                     # Re-raise other errors
                     raise api_error
         except Exception as e:
-            logger.error(f"Error in get_website_beacon_groups: {e}")
+            logger.error("Error in get_website_beacon_groups: %s", e)
             return {"error": f"Failed to get website beacon groups: {e!s}"}
 
 
@@ -319,7 +319,7 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -335,10 +335,10 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -350,8 +350,8 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                 logger.debug("Found nested payload structure, extracting inner payload")
                 request_body = request_body["payload"]
 
-            logger.debug(f"Final request_body structure: {request_body}")
-            logger.debug(f"Request body keys: {list(request_body.keys()) if isinstance(request_body, dict) else 'Not a dict'}")
+            logger.debug("Final request_body structure: %s", request_body)
+            logger.debug("Request body keys: %s", list(request_body.keys()) if isinstance(request_body, dict) else 'Not a dict')
 
             try:
                 from instana_client.models.get_website_beacons import (
@@ -359,7 +359,7 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GetWebsiteBeacons")
             except ImportError as e:
-                logger.debug(f"Error importing GetWebsiteBeacons: {e}")
+                logger.debug("Error importing GetWebsiteBeacons: %s", e)
                 return {"error": f"Failed to import GetWebsiteBeacons: {e!s}"}
 
             # Create an GetWebsiteBeacons object from the request body
@@ -387,11 +387,11 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                 if request_body and "pagination" in request_body:
                     query_params["pagination"] = request_body["pagination"]
 
-                logger.debug(f"Creating GetWebsiteBeacons with params: {query_params}")
+                logger.debug("Creating GetWebsiteBeacons with params: %s", query_params)
                 config_object = GetWebsiteBeacons(**query_params)
                 logger.debug("Successfully created GetWebsiteBeacons object")
             except Exception as e:
-                logger.debug(f"Error creating GetWebsiteBeacons: {e}")
+                logger.debug("Error creating GetWebsiteBeacons: %s", e)
                 return {"error": f"Failed to get website beacons: {e!s}"}
 
             # Call the get_beacons method from the SDK using without_preload_content to avoid NaN validation errors
@@ -424,7 +424,7 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                             result_dict = parsed_data
                             logger.debug("Successfully parsed nested JSON response")
                         except (json.JSONDecodeError, IndexError) as e:
-                            logger.debug(f"Failed to parse nested JSON: {e}")
+                            logger.debug("Failed to parse nested JSON: %s", e)
                             # Fall back to original structure
                             pass
 
@@ -433,13 +433,13 @@ class WebsiteAnalyzeMCPTools(BaseInstanaClient):
                     result_dict = {"beacons": result_dict, "count": len(result_dict)}
                 elif not isinstance(result_dict, dict):
                     result_dict = {"data": result_dict}
-                logger.debug(f"Result from get_website_beacons: {result_dict}")
+                logger.debug("Result from get_website_beacons: %s", result_dict)
                 return result_dict
             except Exception as api_error:
                 # Handle validation errors from the SDK, particularly for customMetric 'NaN' values
                 error_msg = str(api_error)
-                logger.debug(f"API error details: {error_msg}")
+                logger.debug("API error details: %s", error_msg)
                 return {"error": error_msg}
         except Exception as e:
-            logger.error(f"Error in get_website_beacons: {e}")
+            logger.error("Error in get_website_beacons: %s", e)
             return {"error": f"Failed to get website beacons: {e!s}"}
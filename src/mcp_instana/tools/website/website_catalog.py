@@ -13,7 +13,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp.types import ToolAnnotations
@@ -79,10 +79,10 @@ class WebsiteCatalogMCPTools(BaseInstanaClient):
             else:
                 result_dict = {"data": result_list}
 
-            logger.debug(f"Result from get_website_catalog_metrics: {result_dict}")
+            logger.debug("Result from get_website_catalog_metrics: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website_catalog_metrics: {e}", exc_info=True)
+            logger.error("Error in get_website_catalog_metrics: %s", e, exc_info=True)
             return {"error": f"Failed to get website catalog metrics: {e!s}"}
 
     @register_as_tool(
@@ -130,10 +130,10 @@ class WebsiteCatalogMCPTools(BaseInstanaClient):
             else:
                 result_dict = {"data": result_list}
 
-            logger.debug(f"Result from get_website_catalog_tags: {result_dict}")
+            logger.debug("Result from get_website_catalog_tags: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website_catalog_tags: {e}", exc_info=True)
+            logger.error("Error in get_website_catalog_tags: %s", e, exc_info=True)
             return {"error": f"Failed to get website catalog tags: {e!s}"}
 
     @register_as_tool(
@@ -179,8 +179,8 @@ class WebsiteCatalogMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_website_tag_catalog: {result_dict}")
+            logger.debug("Result from get_website_tag_catalog: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website_tag_catalog: {e}", exc_info=True)
+            logger.error("Error in get_website_tag_catalog: %s", e, exc_info=True)
             return {"error": f"Failed to get website tag catalog: {e!s}"}
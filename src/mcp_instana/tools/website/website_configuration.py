@@ -13,7 +13,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp.types import ToolAnnotations
@@ -64,10 +64,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_websites: {result_dict}")
+            logger.debug("Result from get_websites: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_websites: {e}", exc_info=True)
+            logger.error("Error in get_websites: %s", e, exc_info=True)
             return [{"error": f"Failed to get websites: {e!s}"}]
 
     @register_as_tool(
@@ -89,7 +89,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing website data or error information
         """
         try:
-            logger.debug(f"get_website called with website_id={website_id}")
+            logger.debug("get_website called with website_id=%s", website_id)
 
             # Call the get_website method from the SDK
             result = api_client.get_website(website_id=website_id)
@@ -101,10 +101,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_website: {result_dict}")
+            logger.debug("Result from get_website: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website: {e}", exc_info=True)
+            logger.error("Error in get_website: %s", e, exc_info=True)
             return {"error": f"Failed to get website: {e!s}"}
 
     @register_as_tool(
@@ -141,7 +141,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -157,10 +157,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -174,9 +174,9 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     query_params["display_name"] = request_body["display_name"]
                 if request_body and "id" in request_body:
                     query_params["id"] = request_body["id"]
-                logger.debug(f"Creating Website with params: {query_params}")
+                logger.debug("Creating Website with params: %s", query_params)
             except Exception as e:
-                logger.debug(f"Error creating create_website: {e}")
+                logger.debug("Error creating create_website: %s", e)
                 return {"error": f"Failed to create website: {e!s}"}
 
             # Call the create_website method from the SDK
@@ -194,10 +194,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     "message": "Create website"
                 }
 
-            logger.debug(f"Result from create_website: {result_dict}")
+            logger.debug("Result from create_website: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in create_website: {e}")
+            logger.error("Error in create_website: %s", e)
             return {"error": f"Failed to create website: {e!s}"}
 
     @register_as_tool(
@@ -219,7 +219,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing deletion result or error information
         """
         try:
-            logger.debug(f"delete_website called with website_id={website_id}")
+            logger.debug("delete_website called with website_id=%s", website_id)
 
             # Call the delete_website method from the SDK
             api_client.delete_website(website_id=website_id)
@@ -227,7 +227,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             logger.debug("Website deleted successfully")
             return {"success": True, "message": f"Website {website_id} deleted successfully"}
         except Exception as e:
-            logger.error(f"Error in delete_website: {e}", exc_info=True)
+            logger.error("Error in delete_website: %s", e, exc_info=True)
             return {"error": f"Failed to delete website: {e!s}"}
 
     @register_as_tool(
@@ -255,7 +255,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
         """
 
         try:
-            logger.debug(f"rename_website called with website_id={website_id}")
+            logger.debug("rename_website called with website_id=%s", website_id)
 
             if not website_id:
                 return {"error": "website_id parameter is required"}
@@ -270,10 +270,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from rename_website: {result_dict}")
+            logger.debug("Result from rename_website: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in rename_website: {e}", exc_info=True)
+            logger.error("Error in rename_website: %s", e, exc_info=True)
             return {"error": f"Failed to rename website: {e!s}"}
 
     @register_as_tool(
@@ -298,7 +298,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing geo-location configuration or error information
         """
         try:
-            logger.debug(f"get_website_geo_location_configuration called with website_id={website_id}")
+            logger.debug("get_website_geo_location_configuration called with website_id=%s", website_id)
 
             # Call the get_website_geo_location_configuration method from the SDK
             result = api_client.get_website_geo_location_configuration(website_id=website_id)
@@ -310,10 +310,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_website_geo_location_configuration: {result_dict}")
+            logger.debug("Result from get_website_geo_location_configuration: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website_geo_location_configuration: {e}", exc_info=True)
+            logger.error("Error in get_website_geo_location_configuration: %s", e, exc_info=True)
             return {"error": f"Failed to get website geo-location configuration: {e!s}"}
 
     @register_as_tool(
@@ -351,7 +351,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -367,10 +367,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -383,7 +383,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GeoLocationConfiguration")
             except ImportError as e:
-                logger.debug(f"Error importing GeoLocationConfiguration: {e}")
+                logger.debug("Error importing GeoLocationConfiguration: %s", e)
                 return {"error": f"Failed to import GeoLocationConfiguration: {e!s}"}
 
             # Create an GeoLocationConfiguration object from the request body
@@ -406,11 +406,11 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     elif "geo_mapping_rules" in request_body:
                         query_params["geo_mapping_rules"] = request_body["geo_mapping_rules"]
 
-                logger.debug(f"Creating GeoLocationConfiguration with params: {query_params}")
+                logger.debug("Creating GeoLocationConfiguration with params: %s", query_params)
                 config_object = GeoLocationConfiguration(**query_params)
                 logger.debug("Successfully created GeoLocationConfiguration object")
             except Exception as e:
-                logger.debug(f"Error creating GeoLocationConfiguration: {e}")
+                logger.debug("Error creating GeoLocationConfiguration: %s", e)
                 return {"error": f"Failed to create GeoLocationConfiguration: {e!s}"}
 
             # Call the update_website_geo_location_configuration method from the SDK
@@ -429,10 +429,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     "message": "Update website geo-location configuration"
                 }
 
-            logger.debug(f"Result from update_website_geo_location_configuration: {result_dict}")
+            logger.debug("Result from update_website_geo_location_configuration: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_website_geo_location_configuration: {e}")
+            logger.error("Error in update_website_geo_location_configuration: %s", e)
             return {"error": f"Failed to update website geo-location configuration: {e!s}"}
 
     @register_as_tool(
@@ -454,7 +454,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing IP masking configuration or error information
         """
         try:
-            logger.debug(f"get_website_ip_masking_configuration called with website_id={website_id}")
+            logger.debug("get_website_ip_masking_configuration called with website_id=%s", website_id)
 
             # Call the get_website_ip_masking_configuration method from the SDK
             result = api_client.get_website_ip_masking_configuration(website_id=website_id)
@@ -466,10 +466,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from get_website_ip_masking_configuration: {result_dict}")
+            logger.debug("Result from get_website_ip_masking_configuration: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website_ip_masking_configuration: {e}", exc_info=True)
+            logger.error("Error in get_website_ip_masking_configuration: %s", e, exc_info=True)
             return {"error": f"Failed to get website IP masking configuration: {e!s}"}
 
     @register_as_tool(
@@ -510,7 +510,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -526,10 +526,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -542,7 +542,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported IpMaskingConfiguration")
             except ImportError as e:
-                logger.debug(f"Error importing IpMaskingConfiguration: {e}")
+                logger.debug("Error importing IpMaskingConfiguration: %s", e)
                 return {"error": f"Failed to import IpMaskingConfiguration: {e!s}"}
 
             # Create an IpMaskingConfiguration object from the request body
@@ -559,11 +559,11 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     elif "ip_masking" in request_body:
                         query_params["ip_masking"] = request_body["ip_masking"]
 
-                logger.debug(f"Creating IpMaskingConfiguration with params: {query_params}")
+                logger.debug("Creating IpMaskingConfiguration with params: %s", query_params)
                 config_object = IpMaskingConfiguration(**query_params)
                 logger.debug("Successfully created IpMaskingConfiguration object")
             except Exception as e:
-                logger.debug(f"Error creating IpMaskingConfiguration: {e}")
+                logger.debug("Error creating IpMaskingConfiguration: %s", e)
                 return {"error": f"Failed to create IpMaskingConfiguration: {e!s}"}
 
             # Call the update_website_geo_location_configuration method from the SDK
@@ -582,10 +582,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     "message": "Update website ip-masking configuration"
                 }
 
-            logger.debug(f"Result from update_website_ip_masking_configuration: {result_dict}")
+            logger.debug("Result from update_website_ip_masking_configuration: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in update_website_ip_masking_configuration: {e}")
+            logger.error("Error in update_website_ip_masking_configuration: %s", e)
             return {"error": f"Failed to update website ip-masking configuration: {e!s}"}
 
     @register_as_tool(
@@ -607,7 +607,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             List containing custom geo mapping rules or error information
         """
         try:
-            logger.debug(f"get_website_geo_mapping_rules called with website_id={website_id}")
+            logger.debug("get_website_geo_mapping_rules called with website_id=%s", website_id)
 
             # Call the get_website_geo_mapping_rules method from the SDK
             # Use the raw response method to get the actual CSV data
@@ -626,7 +626,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     csv_data = str(result)
 
             except Exception as api_error:
-                logger.warning(f"High-level API call failed: {api_error}, trying raw response")
+                logger.warning("High-level API call failed: %s, trying raw response", api_error)
                 # Fallback to raw HTTP response
                 response = api_client.get_website_geo_mapping_rules_without_preload_content(website_id=website_id)
                 if hasattr(response, 'data'):
@@ -649,10 +649,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's not CSV but has data, return as single item
                 result_list.append({"data": csv_data})
 
-            logger.debug(f"Result from get_website_geo_mapping_rules: {result_list}")
+            logger.debug("Result from get_website_geo_mapping_rules: %s", result_list)
             return result_list
         except Exception as e:
-            logger.error(f"Error in get_website_geo_mapping_rules: {e}", exc_info=True)
+            logger.error("Error in get_website_geo_mapping_rules: %s", e, exc_info=True)
             return [{"error": f"Failed to get website geo mapping rules: {e!s}"}]
 
     @register_as_tool(
@@ -678,7 +678,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             Dictionary containing custom geo mapping rules or error information
         """
         try:
-            logger.debug(f"set_website_geo_mapping_rules called with website_id={website_id}")
+            logger.debug("set_website_geo_mapping_rules called with website_id=%s", website_id)
 
             if not website_id:
                 return {"error": "website_id parameter is required"}
@@ -697,10 +697,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from set_website_geo_mapping_rules: {result_dict}")
+            logger.debug("Result from set_website_geo_mapping_rules: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in set_website_geo_mapping_rules: {e}", exc_info=True)
+            logger.error("Error in set_website_geo_mapping_rules: %s", e, exc_info=True)
             return {"error": f"Failed to set website geo mapping rules: {e!s}"}
 
     @register_as_tool(
@@ -758,10 +758,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                     "message": "Upload source map file"
                 }
 
-            logger.debug(f"Result from upload_source_map_file: {result_dict}")
+            logger.debug("Result from upload_source_map_file: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in upload_source_map_file: {e}")
+            logger.error("Error in upload_source_map_file: %s", e)
             return {"error": f"Failed to upload source map file: {e!s}"}
 
     @register_as_tool(
@@ -792,7 +792,7 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
             if not source_map_config_id:
                 return {"error": "source_map_config_id parameter is required"}
 
-            logger.debug(f"clear_source_map_upload_configuration called with website_id={website_id} and source_map_config_id={source_map_config_id}")
+            logger.debug("clear_source_map_upload_configuration called with website_id=%s and source_map_config_id=%s", website_id, source_map_config_id)
 
             # Call the clear_source_map_upload_configuration method from the SDK
             result = api_client.clear_source_map_upload_configuration(
@@ -806,10 +806,10 @@ class WebsiteConfigurationMCPTools(BaseInstanaClient):
                 # If it's already a dict or another format, use it as is
                 result_dict = result
 
-            logger.debug(f"Result from clear_source_map_upload_configuration: {result_dict}")
+            logger.debug("Result from clear_source_map_upload_configuration: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in clear_source_map_upload_configuration: {e}", exc_info=True)
+            logger.error("Error in clear_source_map_upload_configuration: %s", e, exc_info=True)
             return {"error": f"Failed to clear source map upload configuration: {e!s}"}
 
 
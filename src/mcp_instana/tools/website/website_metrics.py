@@ -15,7 +15,7 @@ try:
 except ImportError as e:
     import logging
     logger = logging.getLogger(__name__)
-    logger.error(f"Error importing Instana SDK: {e}", exc_info=True)
+    logger.error("Error importing Instana SDK: %s", e, exc_info=True)
     raise
 
 from mcp.types import ToolAnnotations
@@ -64,7 +64,7 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
             if not timestamp:
                 return [{"error": "timestamp parameter is required"}]
 
-            logger.debug(f"get_website_page_load called with page_id={page_id}, timestamp={timestamp}")
+            logger.debug("get_website_page_load called with page_id=%s, timestamp=%s", page_id, timestamp)
 
             # Call the get_page_load method from the SDK
             result = api_client.get_page_load(
@@ -86,11 +86,11 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
                 # If it's already a list or another format, use it as is
                 result_list = result
 
-            logger.debug(f"Result from get_website_page_load: {result_list}")
+            logger.debug("Result from get_website_page_load: %s", result_list)
             return result_list
 
         except Exception as e:
-            logger.error(f"Error in get_website_page_load: {e}", exc_info=True)
+            logger.error("Error in get_website_page_load: %s", e, exc_info=True)
             return [{"error": f"Failed to get website page load: {e!s}"}]
 
     @register_as_tool(
@@ -160,7 +160,7 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
                         logger.debug("Successfully parsed payload as JSON")
                         request_body = parsed_payload
                     except json.JSONDecodeError as e:
-                        logger.debug(f"JSON parsing failed: {e}, trying with quotes replaced")
+                        logger.debug("JSON parsing failed: %s, trying with quotes replaced", e)
 
                         # Try replacing single quotes with double quotes
                         fixed_payload = payload.replace("'", "\"")
@@ -176,10 +176,10 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
                                 logger.debug("Successfully parsed payload as Python literal")
                                 request_body = parsed_payload
                             except (SyntaxError, ValueError) as e2:
-                                logger.debug(f"Failed to parse payload string: {e2}")
+                                logger.debug("Failed to parse payload string: %s", e2)
                                 return {"error": f"Invalid payload format: {e2}", "payload": payload}
                 except Exception as e:
-                    logger.debug(f"Error parsing payload string: {e}")
+                    logger.debug("Error parsing payload string: %s", e)
                     return {"error": f"Failed to parse payload: {e}", "payload": payload}
             else:
                 # If payload is already a dictionary, use it directly
@@ -192,7 +192,7 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
                 )
                 logger.debug("Successfully imported GetWebsiteMetricsV2")
             except ImportError as e:
-                logger.debug(f"Error importing GetWebsiteMetricsV2: {e}")
+                logger.debug("Error importing GetWebsiteMetricsV2: %s", e)
                 return {"error": f"Failed to import GetWebsiteMetricsV2: {e!s}"}
 
             # Create an GetWebsiteMetricsV2 object from the request body
@@ -224,11 +224,11 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
                     elif "time_frame" in request_body:
                         query_params["time_frame"] = request_body["time_frame"]
 
-                logger.debug(f"Creating get_website_beacon_metrics_v2 with params: {query_params}")
+                logger.debug("Creating get_website_beacon_metrics_v2 with params: %s", query_params)
                 config_object = GetWebsiteMetricsV2(**query_params)
                 logger.debug("Successfully created GetWebsiteMetricsV2 object")
             except Exception as e:
-                logger.debug(f"Error creating get_website_beacon_metrics_v2: {e}")
+                logger.debug("Error creating get_website_beacon_metrics_v2: %s", e)
                 return {"error": f"Failed to get website beacon metrics: {e!s}"}
 
             # Call the get_beacon_metrics_v2 method from the SDK
@@ -246,8 +246,8 @@ class WebsiteMetricsMCPTools(BaseInstanaClient):
                     "message": "Get website beacon metrics"
                 }
 
-            logger.debug(f"Result from get_website_beacon_metrics_v2: {result_dict}")
+            logger.debug("Result from get_website_beacon_metrics_v2: %s", result_dict)
             return result_dict
         except Exception as e:
-            logger.error(f"Error in get_website_beacon_metrics_v2: {e}")
+            logger.error("Error in get_website_beacon_metrics_v2: %s", e)
             return {"error": f"Failed to get website beacon metrics: {e!s}"}
@@ -4,10 +4,11 @@ Base Instana API Client Module
 This module provides the base client for interacting with the Instana API.
 """
 
+import json
 import os
 import sys
 from functools import wraps
-from typing import Any, Callable, Dict, Union
+from typing import Any, Callable, Dict, Tuple, Union
 
 import requests
 from fastmcp import FastMCP
@@ -50,6 +51,74 @@ def register_as_tool(title=None, annotations=None):
 
     return decorator
 
+def safe_dump(obj: Any, max_len: int = 2000, max_items: int = 50) -> str:
+    """
+    Serialize an object to indented JSON for logging.
+
+    Values that are not JSON serializable are converted with str(), and objects
+    that cannot be serialized at all are logged with repr(). The output is
+    truncated to max_len characters. Only the top-level object is checked against
+    max_items: a dictionary or list with more entries is summarized instead of
+    serialized, while nested containers are always serialized in full.
+
+    Args:
+        obj: The object to serialize
+        max_len: Maximum length of the output before truncation
+        max_items: Maximum number of entries of a top-level dictionary or list to serialize
+
+    Returns:
+        The JSON string, or a short summary or the repr() of the object
+    """
+    if isinstance(obj, (dict, list)) and len(obj) > max_items:
+        return f"<{type(obj).__name__} len={len(obj)}>"
+
+    try:
+        s = json.dumps(obj, default=str, indent=2)
+    except (TypeError, ValueError):
+        # Logging must never fail the call, e.g. on tuple keys or circular references
+        s = repr(obj)
+    if len(s) > max_len:
+        return s[:max_len] + "...(truncated)"
+    return s
+
+# Instana API clients shared across tool calls, keyed by (base_url, token), so that
+# their connection pools are reused instead of reconnecting on every call.
+# Ordered from the least to the most recently used client.
+_API_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_MAX_API_CLIENTS = 32
+
+def get_api_client(base_url: str, token: str):
+    """
+    Get the Instana API client for the given credentials, creating it on first use.
+
+    Args:
+        base_url: The Instana base URL
+        token: The Instana API token
+
+    Returns:
+        The shared ApiClient instance
+    """
+    key = (base_url, token)
+    # Popped and inserted again below so that the client moves to the most recently used end
+    api_client = _API_CLIENTS.pop(key, None)
+    if api_client is None:
+        from instana_client.api_client import ApiClient
+        from instana_client.configuration import Configuration
+
+        configuration = Configuration()
+        configuration.host = base_url
+        configuration.api_key['ApiKeyAuth'] = token
+        configuration.api_key_prefix['ApiKeyAuth'] = 'apiToken'
+        configuration.default_headers = {"User-Agent": "MCP-server/0.1.0"}
+
+        # Evict the least recently used client to bound the number of open connection pools
+        if len(_API_CLIENTS) >= _MAX_API_CLIENTS:
+            _API_CLIENTS.pop(next(iter(_API_CLIENTS)))
+
+        api_client = ApiClient(configuration=configuration)
+    _API_CLIENTS[key] = api_client
+    return api_client
+
 def get_instana_credentials():
     """Get Instana credentials from environment variables for stdio mode."""
     # For stdio mode, use INSTANA_API_TOKEN and INSTANA_BASE_URL
@@ -126,18 +195,8 @@ def with_header_auth(api_class, allow_mock=True):
                         print(" Using header-based authentication (HTTP mode)", file=sys.stderr)
                         print(" instana_base_url: ", instana_base_url)
 
-                        # Import SDK components
-                        from instana_client.api_client import ApiClient
-                        from instana_client.configuration import Configuration
-
-                        # Create API client from headers
-                        configuration = Configuration()
-                        configuration.host = instana_base_url
-                        configuration.api_key['ApiKeyAuth'] = instana_token
-                        configuration.api_key_prefix['ApiKeyAuth'] = 'apiToken'
-                        configuration.default_headers = {"User-Agent": "MCP-server/0.1.0"}
-
-                        api_client_instance = ApiClient(configuration=configuration)
+                        # Get the API client for the credentials from the headers
+                        api_client_instance = get_api_client(instana_base_url, instana_token)
                         api_instance = api_class(api_client=api_client_instance)
 
                         # Add the API instance to kwargs so the decorated function can use it
@@ -181,16 +240,7 @@ def with_header_auth(api_class, allow_mock=True):
                 else:
                     # Create a new API client using constructor credentials
                     print(" Creating new API client with constructor credentials", file=sys.stderr)
-                    from instana_client.api_client import ApiClient
-                    from instana_client.configuration import Configuration
-
-                    configuration = Configuration()
-                    configuration.host = self.base_url
-                    configuration.api_key['ApiKeyAuth'] = self.read_token
-                    configuration.api_key_prefix['ApiKeyAuth'] = 'apiToken'
-                    configuration.default_headers = {"User-Agent": "MCP-server/0.1.0"}
-
-                    api_client_instance = ApiClient(configuration=configuration)
+                    api_client_instance = get_api_client(self.base_url, self.read_token)
                     api_instance = api_class(api_client=api_client_instance)
 
                     kwargs['api_client'] = api_instance
@@ -0,0 +1,107 @@
+"""Tests for the command line parsing of the MCP server entry point."""
+import unittest
+from unittest.mock import patch
+
+# Imported upfront so that _bootstrap() finds it already loaded
+from mcp_instana import server, settings
+from mcp_instana.main import (
+    TOOL_CATEGORY_PACKAGES,
+    Args,
+    _bootstrap,
+    _parse_argv,
+    validate_credentials,
+)
+
+
+class TestParseArgv(unittest.TestCase):
+    """Test cases for the _parse_argv function."""
+
+    def test_defaults(self):
+        """Test that no arguments yield the default values."""
+        self.assertEqual(_parse_argv([]), Args())
+
+    def test_options_with_separate_values(self):
+        """Test the "--option value" form."""
+        args = _parse_argv(["--transport", "streamable-http", "--tools", "infra,app", "--port", "9090"])
+        self.assertEqual(args.transport, "streamable-http")
+        self.assertEqual(args.tools, "infra,app")
+        self.assertEqual(args.port, 9090)
+
+    def test_options_with_inline_values(self):
+        """Test the "--option=value" form."""
+        args = _parse_argv(["--transport=stdio", "--log-level=DEBUG", "--port=9090"])
+        self.assertEqual(args.transport, "stdio")
+        self.assertEqual(args.log_level, "DEBUG")
+        self.assertEqual(args.port, 9090)
+
+    def test_debug_flag(self):
+        """Test that --debug is a flag without value."""
+        self.assertTrue(_parse_argv(["--debug"]).debug)
+
+    def test_help(self):
+        """Test that all help flags are recognized."""
+        for flag in ["-h", "--h", "--help", "-help"]:
+            self.assertTrue(_parse_argv([flag]).help)
+
+    def test_help_with_other_arguments(self):
+        """Test that help cannot be combined with other arguments."""
+        with self.assertRaisesRegex(ValueError, "not allowed with other arguments"):
+            _parse_argv(["--help", "--debug"])
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        for argv in (
+            ["--transport", "sse"],
+            ["--log-level", "TRACE"],
+            ["--port", "abc"],
+            ["--tools"],
+            ["--tools", "--debug"],
+            ["--transport", "--port", "8080"],
+            ["--unknown"],
+        ):
+            with self.assertRaises(ValueError, msg=argv):
+                _parse_argv(argv)
+
+
+class TestValidateCredentials(unittest.TestCase):
+    """Test cases for the validate_credentials function."""
+
+    def test_credentials_provided(self):
+        """Test that credentials are valid when both token and base URL are set."""
+        env = {"INSTANA_API_TOKEN": "token", "INSTANA_BASE_URL": "https://test.instana.io", "PORT": ""}
+        with patch.dict("mcp_instana.main._ENV", env):
+            self.assertTrue(validate_credentials())
+
+    def test_credentials_missing(self):
+        """Test that credentials are invalid when the token or base URL is empty."""
+        env = {"INSTANA_API_TOKEN": "", "INSTANA_BASE_URL": "https://test.instana.io", "PORT": ""}
+        with patch.dict("mcp_instana.main._ENV", env):
+            self.assertFalse(validate_credentials())
+
+
+class TestBootstrap(unittest.TestCase):
+    """Test cases for the _bootstrap function."""
+
+    def _imported_modules(self, categories):
+        with patch.object(settings, "global_tool_categories", categories), \
+             patch("mcp_instana.main.importlib.import_module") as mock_import:
+            _bootstrap()
+        return {call.args[0] for call in mock_import.call_args_list}
+
+    def test_import_enabled_categories_only(self):
+        """Test that only the tool packages of the enabled categories are imported."""
+        self.assertEqual(self._imported_modules(["infra", "events"]),
+                         {"mcp_instana.tools.infrastructure", "mcp_instana.tools.event"})
+
+    def test_import_all_categories(self):
+        """Test that all tool packages are imported when no category is specified."""
+        self.assertEqual(self._imported_modules(None),
+                         {f"mcp_instana.tools.{package}" for package in TOOL_CATEGORY_PACKAGES.values()})
+
+    def test_unknown_category_skipped(self):
+        """Test that unknown categories are skipped."""
+        self.assertEqual(self._imported_modules(["trending"]), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
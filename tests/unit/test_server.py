@@ -0,0 +1,52 @@
+"""Tests for the MCP server module."""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from fastmcp import FastMCP
+from mcp_instana import server, settings
+
+
+class TestFilterTools(unittest.TestCase):
+    """Test cases for the _filter_tools function."""
+
+    def setUp(self):
+        # Use a dedicated server so that the tools registered by other tests are left alone
+        self.mcp = FastMCP(name="Test Server")
+        patcher = patch.object(server, "mcp", self.mcp)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        @self.mcp.tool(tags={"infra"})
+        def infra_tool():
+            return "infra"
+
+        @self.mcp.tool(tags={"app", "metrics"})
+        def app_tool():
+            return "app"
+
+        @self.mcp.tool
+        def untagged_tool():
+            return "untagged"
+
+    def _tool_names(self):
+        return set(asyncio.run(self.mcp.get_tools()))
+
+    def test_no_category_filter(self):
+        """Test that no tool is removed when no category filter is set."""
+        with patch.object(settings, "global_tool_categories_set", None):
+            server._filter_tools()
+
+        self.assertEqual(self._tool_names(), {"infra_tool", "app_tool", "untagged_tool"})
+
+    def test_tools_of_disabled_categories_removed(self):
+        """Test that only the tools of the enabled categories are kept."""
+        with patch.object(settings, "global_tool_categories", ["app"]), \
+             patch.object(settings, "global_tool_categories_set", frozenset({"app"})):
+            server._filter_tools()
+
+        self.assertEqual(self._tool_names(), {"app_tool"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for the helpers of the utils module."""
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from mcp_instana import utils
+from mcp_instana.utils import get_api_client, safe_dump
+
+
+class TestSafeDump(unittest.TestCase):
+    """Test cases for the safe_dump function."""
+
+    def test_dump_dict(self):
+        """Test that a dictionary is serialized to indented JSON."""
+        obj = {"items": [1, 2], "name": "test"}
+        self.assertEqual(json.loads(safe_dump(obj)), obj)
+        self.assertIn("\n  ", safe_dump(obj))
+
+    def test_dump_not_serializable(self):
+        """Test that values that are not JSON serializable are converted with str()."""
+        value = object()
+        self.assertEqual(json.loads(safe_dump({"value": value})), {"value": str(value)})
+
+    def test_dump_not_json_serializable(self):
+        """Test that objects that cannot be serialized to JSON are logged with repr()."""
+        circular = {}
+        circular["self"] = circular
+        for obj in ({(1, 2): 1}, circular):
+            self.assertEqual(safe_dump(obj), repr(obj))
+        obj = {(1, 2): "x" * 100}
+        self.assertEqual(safe_dump(obj, max_len=20), repr(obj)[:20] + "...(truncated)")
+
+    def test_dump_large_container(self):
+        """Test that top-level containers with too many entries are summarized."""
+        self.assertEqual(safe_dump(list(range(100))), "<list len=100>")
+        self.assertEqual(safe_dump({str(i): i for i in range(3)}, max_items=2), "<dict len=3>")
+        # Nested containers are not summarized
+        self.assertEqual(json.loads(safe_dump({"items": list(range(3))}, max_items=2)), {"items": [0, 1, 2]})
+
+    def test_dump_truncated(self):
+        """Test that the output is truncated to max_len characters."""
+        result = safe_dump({"name": "x" * 100}, max_len=20)
+        self.assertTrue(result.endswith("...(truncated)"))
+        self.assertEqual(len(result), 20 + len("...(truncated)"))
+
+
+class TestGetApiClient(unittest.TestCase):
+    """Test cases for the get_api_client function."""
+
+    def setUp(self):
+        for patcher in (
+            patch.dict(utils._API_CLIENTS, clear=True),
+            patch('instana_client.api_client.ApiClient',
+                  side_effect=lambda configuration: MagicMock(configuration=configuration)),
+            patch('instana_client.configuration.Configuration',
+                  side_effect=lambda: SimpleNamespace(api_key={}, api_key_prefix={})),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_client_reused_for_same_credentials(self):
+        """Test that the same client is returned for the same credentials."""
+        client = get_api_client("https://test.instana.io", "token")
+        self.assertIs(get_api_client("https://test.instana.io", "token"), client)
+        self.assertEqual(client.configuration.host, "https://test.instana.io")
+        self.assertEqual(client.configuration.api_key['ApiKeyAuth'], "token")
+
+    def test_client_per_credentials(self):
+        """Test that different credentials get different clients."""
+        client = get_api_client("https://test.instana.io", "token")
+        self.assertIsNot(get_api_client("https://test.instana.io", "other-token"), client)
+        self.assertIsNot(get_api_client("https://other.instana.io", "token"), client)
+
+    def test_oldest_client_evicted(self):
+        """Test that the number of cached clients is bounded."""
+        with patch.object(utils, "_MAX_API_CLIENTS", 2):
+            first = get_api_client("https://test.instana.io", "token-1")
+            get_api_client("https://test.instana.io", "token-2")
+            get_api_client("https://test.instana.io", "token-3")
+
+            self.assertEqual(len(utils._API_CLIENTS), 2)
+            self.assertIsNot(get_api_client("https://test.instana.io", "token-1"), first)
+
+    def test_recently_used_client_kept(self):
+        """Test that the least recently used client is evicted, not the first one created."""
+        with patch.object(utils, "_MAX_API_CLIENTS", 2):
+            first = get_api_client("https://test.instana.io", "token-1")
+            second = get_api_client("https://test.instana.io", "token-2")
+            self.assertIs(get_api_client("https://test.instana.io", "token-1"), first)
+            get_api_client("https://test.instana.io", "token-3")
+
+            self.assertIs(get_api_client("https://test.instana.io", "token-1"), first)
+            self.assertIsNot(get_api_client("https://test.instana.io", "token-2"), second)
+
+
+if __name__ == '__main__':
+    unittest.main()
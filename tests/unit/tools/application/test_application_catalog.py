@@ -113,13 +113,11 @@ class TestApplicationCatalogMCPTools(unittest.TestCase):
         self.assertEqual(self.client.read_token, self.read_token)
         self.assertEqual(self.client.base_url, self.base_url)
 
-    @patch('mcp_instana.tools.application.application_catalog.datetime')
-    def test_get_application_tag_catalog_with_defaults(self, mock_datetime):
+    @patch('mcp_instana.tools.application.application_catalog.time')
+    def test_get_application_tag_catalog_with_defaults(self, mock_time):
         """Test get_application_tag_catalog with default parameters"""
-        # Set up the mock datetime
-        from datetime import datetime
-        mock_now = datetime(2023, 1, 1, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        # Set up the mock time
+        mock_time.time_ns.return_value = 1672574400 * 10**9  # 2023-01-01 12:00:00 UTC
 
         # Set up the mock response
         mock_response = MagicMock()
@@ -177,13 +177,11 @@ class TestApplicationResourcesMCPTools(unittest.TestCase):
         """Tear down test fixtures"""
         # No need to stop patchers since we're directly mocking the module imports
         pass
-    @patch('mcp_instana.tools.application.application_resources.datetime')
-    def test_get_application_endpoints_with_defaults(self, mock_datetime):
+    @patch('mcp_instana.tools.application.application_resources.time')
+    def test_get_application_endpoints_with_defaults(self, mock_time):
         """Test get_application_endpoints with default parameters"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_result = {
@@ -280,13 +278,11 @@ class TestApplicationResourcesMCPTools(unittest.TestCase):
         self.assertIn("Failed to get application endpoints", result["error"])
         self.assertIn("Test error", result["error"])
 
-    @patch('mcp_instana.tools.application.application_resources.datetime')
-    def test_get_application_services_with_defaults(self, mock_datetime):
+    @patch('mcp_instana.tools.application.application_resources.time')
+    def test_get_application_services_with_defaults(self, mock_time):
         """Test get_application_services with default parameters"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_result = {
@@ -390,13 +386,11 @@ class TestApplicationResourcesMCPTools(unittest.TestCase):
         self.assertIn("Failed to get application services", result["error"])
         self.assertIn("Test error", result["error"])
 
-    @patch('mcp_instana.tools.application.application_resources.datetime')
-    def test_get_applications_with_defaults(self, mock_datetime):
+    @patch('mcp_instana.tools.application.application_resources.time')
+    def test_get_applications_with_defaults(self, mock_time):
         """Test get_applications with default parameters"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_result = {
@@ -490,13 +484,11 @@ class TestApplicationResourcesMCPTools(unittest.TestCase):
         self.assertIn("Error: Failed to get applications", result[0])
         self.assertIn("Test error", result[0])
 
-    @patch('mcp_instana.tools.application.application_resources.datetime')
-    def test_get_services_with_defaults(self, mock_datetime):
+    @patch('mcp_instana.tools.application.application_resources.time')
+    def test_get_services_with_defaults(self, mock_time):
         """Test get_services with default parameters"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_result = {
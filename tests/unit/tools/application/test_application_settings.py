@@ -137,7 +137,7 @@ class TestApplicationSettingsMCPTools(unittest.TestCase):
         self.base_url = "https://test.instana.io"
 
         # Patch the with_header_auth decorator
-        self.patcher = patch('src.core.utils.with_header_auth', mock_with_header_auth)
+        self.patcher = patch('mcp_instana.utils.with_header_auth', mock_with_header_auth)
         self.patcher.start()
 
         self.client = ApplicationSettingsMCPTools(read_token=self.read_token, base_url=self.base_url)
@@ -267,13 +267,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("error", result)
         self.assertIn("Failed to get event", result["error"])
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_kubernetes_info_events_with_defaults(self, mock_datetime):
+    def test_get_kubernetes_info_events_with_defaults(self, mock_datetime, mock_time):
         """Test get_kubernetes_info_events with default parameters"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_event1 = MagicMock()
@@ -330,13 +329,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertEqual(problem_analyses[0]["details"], ["Pod crashed due to OOM"])
         self.assertEqual(problem_analyses[0]["fix_suggestions"], ["Increase memory limits"])
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_kubernetes_info_events_with_time_range(self, mock_datetime):
+    def test_get_kubernetes_info_events_with_time_range(self, mock_datetime, mock_time):
         """Test get_kubernetes_info_events with natural language time range"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response (empty list for simplicity)
         self.events_api.kubernetes_info_events = MagicMock(return_value=[])
@@ -374,13 +372,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("error", result)
         self.assertIn("Failed to get Kubernetes info events", result["error"])
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_kubernetes_info_events_with_empty_result(self, mock_datetime):
+    def test_get_kubernetes_info_events_with_empty_result(self, mock_datetime, mock_time):
         """Test get_kubernetes_info_events with empty result"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response as empty list
@@ -395,13 +392,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("time_range", result)
         self.assertEqual(result["events_count"], 0)
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_agent_monitoring_events_with_defaults(self, mock_datetime):
+    def test_get_agent_monitoring_events_with_defaults(self, mock_datetime, mock_time):
         """Test get_agent_monitoring_events with default parameters"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_event1 = MagicMock()
@@ -460,13 +456,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertEqual(len(problem_analyses[0]["affected_entities"]), 2)
         self.assertEqual(problem_analyses[0]["entity_types"], ["host"])
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_agent_monitoring_events_with_time_range(self, mock_datetime):
+    def test_get_agent_monitoring_events_with_time_range(self, mock_datetime, mock_time):
         """Test get_agent_monitoring_events with natural language time range"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response (empty list for simplicity)
         self.events_api.get_events.return_value = []
@@ -498,13 +493,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("error", result)
         self.assertIn("Failed to get agent monitoring events", result["error"])
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_agent_monitoring_events_with_empty_result(self, mock_datetime):
+    def test_get_agent_monitoring_events_with_empty_result(self, mock_datetime, mock_time):
         """Test get_agent_monitoring_events with empty result"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response as empty list
@@ -519,13 +513,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("time_range", result)
         self.assertEqual(result["events_count"], 0)
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_kubernetes_info_events_with_various_time_ranges(self, mock_datetime):
+    def test_get_kubernetes_info_events_with_various_time_ranges(self, mock_datetime, mock_time):
         """Test get_kubernetes_info_events with various time range formats"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response (empty list for simplicity)
         self.events_api.kubernetes_info_events = MagicMock(return_value=[])
@@ -565,13 +558,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
                 exclude_triggered_before=None
             )
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_agent_monitoring_events_with_problem_no_prefix(self, mock_datetime):
+    def test_get_agent_monitoring_events_with_problem_no_prefix(self, mock_datetime, mock_time):
         """Test get_agent_monitoring_events with problem field that doesn't have the 'Monitoring issue:' prefix"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_event = MagicMock()
@@ -600,13 +592,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         high_cpu_analysis = next((p for p in problem_analyses if p["problem"] == "High CPU" or p["problem"] == "Monitoring issue: High CPU"), None)
         self.assertIsNotNone(high_cpu_analysis, "High CPU problem analysis not found")
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_agent_monitoring_events_with_non_list_result(self, mock_datetime):
+    def test_get_agent_monitoring_events_with_non_list_result(self, mock_datetime, mock_time):
         """Test get_agent_monitoring_events with non-list result"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response as a single object (not a list)
         mock_event = MagicMock()
@@ -656,13 +647,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("Failed to get agent monitoring events", result["error"])
 
     # Tests for get_changes method
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_changes_method_success(self, mock_datetime):
+    def test_get_changes_method_success(self, mock_datetime, mock_time):
         """Test get_changes method with successful response"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response for get_events_without_preload_content
@@ -822,13 +812,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertIn("Unknown", result["event_types"])
 
     # Additional tests for error handling and edge cases
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_issues_with_exception_in_processing(self, mock_datetime):
+    def test_get_issues_with_exception_in_processing(self, mock_datetime, mock_time):
         """Test get_issues method with exception during event processing"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response to simulate an exception during JSON parsing
@@ -857,13 +846,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
             event_type_filters=["issue"]
         )
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_incidents_with_exception_in_processing(self, mock_datetime):
+    def test_get_incidents_with_exception_in_processing(self, mock_datetime, mock_time):
         """Test get_incidents method with exception during event processing"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response to simulate an exception during JSON parsing
@@ -933,11 +921,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_unusual_time_range(self):
         """Test _process_time_range method with unusual time range format"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with unusual time range
             result_from_time, result_to_time = self.client._process_time_range("last century", None, None)
@@ -951,11 +937,10 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_get_kubernetes_info_events_with_non_dict_event(self):
         """Test get_kubernetes_info_events with non-dictionary event"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time, \
+             patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
             mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
             # Create a mock event that is not a dictionary and doesn't have to_dict
@@ -976,11 +961,10 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_get_kubernetes_info_events_with_many_namespaces(self):
         """Test get_kubernetes_info_events with many namespaces"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time, \
+             patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
             mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
             # Create mock events with many namespaces
@@ -1008,11 +992,10 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_get_agent_monitoring_events_with_default_from_time(self):
         """Test get_agent_monitoring_events with default from_time"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time, \
+             patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
             mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
             # Set up the mock response
@@ -1032,11 +1015,10 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_get_agent_monitoring_events_with_non_dict_event(self):
         """Test get_agent_monitoring_events with non-dictionary event"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time, \
+             patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
             mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
             # Create a mock event that is not a dictionary and doesn't have to_dict
@@ -1057,11 +1039,10 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_get_agent_monitoring_events_with_many_entities(self):
         """Test get_agent_monitoring_events with many entities"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time, \
+             patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
             mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
             # Create mock events with many entities
@@ -1129,13 +1110,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertEqual(result["name"], "Object 1")
 
     # Additional tests for edge cases
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_issues_with_severity_filtering(self, mock_datetime):
+    def test_get_issues_with_severity_filtering(self, mock_datetime, mock_time):
         """Test get_issues method with severity filtering"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response for get_events_without_preload_content
@@ -1186,13 +1166,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
             event_type_filters=["issue"]
         )
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_changes_with_missing_fields(self, mock_datetime):
+    def test_get_changes_with_missing_fields(self, mock_datetime, mock_time):
         """Test get_changes method with missing fields"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response for get_events_without_preload_content
@@ -1234,11 +1213,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_hour_format(self):
         """Test _process_time_range method with hour format"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with hour format
             from_time, to_time = self.client._process_time_range("last 5 hours", None, None)
@@ -1252,11 +1229,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_day_format(self):
         """Test _process_time_range method with day format"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with day format
             from_time, to_time = self.client._process_time_range("last 3 days", None, None)
@@ -1270,11 +1245,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_week_format(self):
         """Test _process_time_range method with week format"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with week format
             from_time, to_time = self.client._process_time_range("last 2 weeks", None, None)
@@ -1288,11 +1261,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_month_format(self):
         """Test _process_time_range method with month format"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with month format
             from_time, to_time = self.client._process_time_range("last 1 month", None, None)
@@ -1306,11 +1277,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_few_hours_format(self):
         """Test _process_time_range method with 'few hours' format"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with 'few hours' format
             from_time, to_time = self.client._process_time_range("last few hours", None, None)
@@ -1324,11 +1293,9 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
 
     def test_process_time_range_with_only_to_time(self):
         """Test _process_time_range method with only to_time provided"""
-        # Set up the mock datetime
-        with patch('mcp_instana.tools.event.events_tools.datetime') as mock_datetime:
-            mock_now = MagicMock()
-            mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-            mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        with patch('mcp_instana.tools.event.events_tools.time') as mock_time:
+            mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
             # Call the method with only to_time
             to_time_value = 500000
@@ -1340,13 +1307,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
             self.assertEqual(from_time, expected_from_time)
             self.assertEqual(to_time, to_time_value)
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_issues_with_size_parameter(self, mock_datetime):
+    def test_get_issues_with_size_parameter(self, mock_datetime, mock_time):
         """Test get_issues with size parameter"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response for get_events_without_preload_content
@@ -1371,13 +1337,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
         self.assertEqual(len(result["events"]), 0)
         self.assertEqual(result["events_count"], 0)
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_incidents_with_size_parameter(self, mock_datetime):
+    def test_get_incidents_with_size_parameter(self, mock_datetime, mock_time):
         """Test get_incidents with size parameter"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response for get_events_without_preload_content
@@ -1412,13 +1377,12 @@ class TestAgentMonitoringEventsMCPTools(unittest.TestCase):
             event_type_filters=["incident"]
         )
 
+    @patch('mcp_instana.tools.event.events_tools.time')
     @patch('mcp_instana.tools.event.events_tools.datetime')
-    def test_get_changes_with_size_parameter(self, mock_datetime):
+    def test_get_changes_with_size_parameter(self, mock_datetime, mock_time):
         """Test get_changes with size parameter"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
         mock_datetime.fromtimestamp = MagicMock(side_effect=lambda ts, *args: datetime.fromtimestamp(ts))
 
         # Set up the mock response for get_events_without_preload_content
@@ -152,13 +152,11 @@ class TestInfrastructureMetricsMCPTools(unittest.TestCase):
         self.assertIn("error", result)
         self.assertEqual("Query is required for this operation", result["error"])
 
-    @patch('mcp_instana.tools.infrastructure.infrastructure_metrics.datetime')
-    def test_get_infrastructure_metrics_with_defaults(self, mock_datetime):
+    @patch('mcp_instana.tools.infrastructure.infrastructure_metrics.time')
+    def test_get_infrastructure_metrics_with_defaults(self, mock_time):
         """Test get_infrastructure_metrics with default time_frame and rollup"""
-        # Set up the mock datetime
-        mock_now = MagicMock()
-        mock_now.timestamp = MagicMock(return_value=1000)  # 1000 seconds since epoch
-        mock_datetime.now = MagicMock(return_value=mock_now)
+        # Set up the mock time
+        mock_time.time_ns = MagicMock(return_value=1000 * 10**9)  # 1000 seconds since epoch
 
         # Set up the mock response
         mock_result = {